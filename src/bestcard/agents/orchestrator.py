@@ -1,26 +1,54 @@
-from bestcard.domain.models import SpendScenario
+from datetime import date
+
+from pydantic import ValidationError
+
+from bestcard.domain.models import CardPolicy, SpendProfile, SpendScenario
+from bestcard.engine.catalog import CompiledCatalog
+from bestcard.engine.portfolio import optimize_portfolio
 from bestcard.engine.selectors import rank_cards
 from bestcard.nlp.parser import parse_scenario
 from bestcard.rag.retriever import retrieve_policy_evidence
+from bestcard.repository.fx_store import FxSnapshot, FxStore
+from bestcard.repository.merchant_store import MerchantStore
 from bestcard.repository.policy_store import PolicyStore
-from bestcard.schemas.requests import RecommendRequest
-from bestcard.schemas.responses import RecommendResponse
+from bestcard.repository.response_cache import ResponseCache
+from bestcard.repository.user_store import UserStore
+from bestcard.schemas.requests import PortfolioRequest, RecommendRequest
+from bestcard.schemas.responses import PortfolioResponse, RecommendResponse
 
 
 class RecommendationOrchestrator:
-    def __init__(self, policy_store: PolicyStore):
+    def __init__(
+        self,
+        policy_store: PolicyStore,
+        user_store: UserStore | None = None,
+        merchant_store: MerchantStore | None = None,
+        fx_store: FxStore | None = None,
+        response_cache: ResponseCache | None = None,
+    ):
         self.policy_store = policy_store
+        self.user_store = user_store
+        self.merchant_store = merchant_store
+        self.fx_store = fx_store
+        self.response_cache = response_cache
+
+    def _resolve_category(self, message: str) -> str | None:
+        if self.merchant_store is None:
+            return None
+        match = self.merchant_store.load_matcher().resolve(message)
+        return match.category if match else None
 
     def _build_scenario(self, request: RecommendRequest) -> SpendScenario:
         if request.message:
             return parse_scenario(
                 message=request.message,
                 amount=request.amount,
-                category=request.category,
+                category=request.category or self._resolve_category(request.message),
                 is_foreign=request.is_foreign,
                 currency=request.currency,
                 include_annual_fee_proration=request.include_annual_fee_proration,
                 monthly_spend_estimate=request.monthly_spend_estimate,
+                transaction_date=request.transaction_date,
             )
 
         if request.amount is None or request.category is None:
@@ -28,28 +56,129 @@ class RecommendationOrchestrator:
 
         return SpendScenario(
             amount=request.amount,
-            category=request.category,
+            category=request.category.strip().lower(),
             is_foreign=bool(request.is_foreign),
-            currency=request.currency,
+            currency=(request.currency or "USD").upper(),
             include_annual_fee_proration=request.include_annual_fee_proration,
             monthly_spend_estimate=request.monthly_spend_estimate,
+            transaction_date=request.transaction_date,
+        )
+
+    def _wallet(self, user_id: str | None) -> list[str] | None:
+        if user_id is None or self.user_store is None:
+            return None
+
+        profile = self.user_store.get_profile(user_id)
+        if profile is None or not profile.card_ids:
+            return None
+        return profile.card_ids
+
+    def _candidate_cards(
+        self,
+        catalog: CompiledCatalog,
+        user_id: str | None,
+        wallet: list[str] | None,
+    ) -> list[CardPolicy] | CompiledCatalog:
+        if wallet is None:
+            return catalog
+
+        cards = catalog.select(catalog.mask_for(wallet))
+        if not cards:
+            raise ValueError(f"No known cards in wallet of user '{user_id}'.")
+        return cards
+
+    def _cache_key(
+        self,
+        scenario: SpendScenario,
+        catalog: CompiledCatalog,
+        wallet: list[str] | None,
+        full_ranking: bool,
+    ) -> str:
+        fx_version = ""
+        converts = scenario.currency.upper() != catalog.currency or len(catalog.currencies) > 1
+        if converts and self.fx_store is not None:
+            fx_version = self.fx_store.load_snapshot().version
+        # Undated scenarios are evaluated against today's rules, so the day is part of the key.
+        on = scenario.transaction_date or date.today()
+        return ResponseCache.make_key(
+            catalog.version,
+            fx_version,
+            scenario.model_dump_json(),
+            on.isoformat(),
+            ",".join(sorted(set(wallet))) if wallet is not None else "*",
+            str(full_ranking),
         )
 
+    def _fx_snapshot(self, source: str, target: str) -> FxSnapshot:
+        if self.fx_store is None:
+            raise ValueError(f"Cannot convert {source} to {target}: no FX rates configured.")
+        return self.fx_store.load_snapshot()
+
+    def _price_scenario(self, scenario: SpendScenario, currency: str) -> SpendScenario:
+        if scenario.currency.upper() == currency.upper():
+            return scenario
+        return self._fx_snapshot(scenario.currency, currency).convert_scenario(scenario, currency)
+
+    def _fx_factors(self, catalog: CompiledCatalog) -> dict[str, float] | None:
+        """One factor per card currency into ``catalog.currency``; None for a single-currency catalog."""
+        others = sorted(catalog.currencies - {catalog.currency})
+        if not others:
+            return None
+        snapshot = self._fx_snapshot(others[0], catalog.currency)
+        return {code: snapshot.factor(code, catalog.currency) for code in others}
+
     def recommend(self, request: RecommendRequest) -> RecommendResponse:
         scenario = self._build_scenario(request)
-        cards = self.policy_store.load_cards()
-        ranked = rank_cards(cards, scenario)
+        catalog = self.policy_store.load_catalog()
+        wallet = self._wallet(request.user_id)
+
+        cache_key = None
+        if self.response_cache is not None and not request.message:
+            cache_key = self._cache_key(scenario, catalog, wallet, request.full_ranking)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                try:
+                    return RecommendResponse.model_validate_json(cached)
+                except ValidationError:
+                    self.response_cache.discard(cache_key)
+
+        priced = self._price_scenario(scenario, catalog.currency)
+        cards = self._candidate_cards(catalog, request.user_id, wallet)
+        ranked = rank_cards(cards, priced, full_ranking=request.full_ranking, fx_factors=self._fx_factors(catalog))
 
         if not ranked:
             raise ValueError("No cards available.")
 
         best = ranked[0]
-        best_card_policy = next(card for card in cards if card.card_id == best.card_id)
-        evidence = retrieve_policy_evidence(best_card_policy, scenario.category)
+        best_card_policy = catalog.get(best.card_id)
+        evidence = retrieve_policy_evidence(best_card_policy, scenario.category, scenario.transaction_date)
 
-        return RecommendResponse(
+        response = RecommendResponse(
             best_card=best,
             ranked_cards=ranked,
             parsed_scenario=scenario,
+            priced_scenario=priced,
             policy_evidence=evidence,
         )
+        if cache_key is not None:
+            self.response_cache.put(cache_key, response.model_dump_json().encode("utf-8"))
+        return response
+
+    def optimize_portfolio(self, request: PortfolioRequest) -> PortfolioResponse:
+        profile = SpendProfile(
+            category_spend=request.category_spend,
+            foreign_share=request.foreign_share,
+            currency=request.currency,
+        )
+        catalog = self.policy_store.load_catalog()
+        priced = profile
+        if profile.currency.upper() != catalog.currency:
+            priced = self._fx_snapshot(profile.currency, catalog.currency).convert_profile(profile, catalog.currency)
+        portfolio = optimize_portfolio(
+            list(catalog.cards),
+            priced,
+            k=request.k,
+            time_budget_s=request.time_budget_ms / 1000,
+            fx_factors=self._fx_factors(catalog),
+        )
+        return PortfolioResponse(portfolio=portfolio, spend_profile=profile)
@@ -0,0 +1,62 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import HTTPException
+
+
+class AdmissionLimiter:
+    """Concurrency budget with a bounded wait queue; overflow gets 429, queue timeouts 503."""
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        max_queue: int,
+        queue_timeout_s: float,
+        retry_after_s: int = 1,
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout_s = queue_timeout_s
+        self.retry_after_s = retry_after_s
+        self.waiting = 0
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _bound_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+            self.waiting = 0
+        return self._semaphore
+
+    def _reject(self, status_code: int, reason: str) -> HTTPException:
+        return HTTPException(
+            status_code=status_code,
+            detail=f"{self.name} requests are {reason}, retry later.",
+            headers={"Retry-After": str(self.retry_after_s)},
+        )
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        semaphore = self._bound_semaphore()
+        if semaphore.locked():
+            if self.waiting >= self.max_queue:
+                raise self._reject(429, "over capacity")
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout_s)
+            except TimeoutError as exc:
+                raise self._reject(503, "queued past their deadline") from exc
+            finally:
+                self.waiting -= 1
+        else:
+            await semaphore.acquire()
+
+        try:
+            yield
+        finally:
+            semaphore.release()
@@ -1,13 +1,26 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 
 from bestcard.api.routes.health import router as health_router
+from bestcard.api.routes.portfolio import router as portfolio_router
+from bestcard.api.routes.recommend import orchestrator
 from bestcard.api.routes.recommend import router as recommend_router
 from bestcard.config import settings
 
-app = FastAPI(title="BestCard API", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if orchestrator.merchant_store is not None:
+        orchestrator.merchant_store.load_matcher()
+    yield
+
+
+app = FastAPI(title="BestCard API", version="0.1.0", lifespan=lifespan)
 app.include_router(health_router)
 app.include_router(recommend_router)
+app.include_router(portfolio_router)
 
 
 def run() -> None:
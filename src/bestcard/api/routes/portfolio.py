@@ -0,0 +1,26 @@
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from bestcard.api.admission import AdmissionLimiter
+from bestcard.api.routes.recommend import orchestrator
+from bestcard.config import settings
+from bestcard.schemas.requests import PortfolioRequest
+from bestcard.schemas.responses import PortfolioResponse
+
+router = APIRouter(tags=["portfolio"])
+limiter = AdmissionLimiter(
+    "portfolio",
+    settings.portfolio_max_concurrency,
+    settings.portfolio_max_queue,
+    settings.portfolio_queue_timeout_s,
+    settings.admission_retry_after_s,
+)
+
+
+@router.post("/portfolio", response_model=PortfolioResponse)
+async def portfolio(request: PortfolioRequest) -> PortfolioResponse:
+    async with limiter.slot():
+        try:
+            return await run_in_threadpool(orchestrator.optimize_portfolio, request)
+        except Exception as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
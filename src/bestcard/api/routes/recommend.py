@@ -1,18 +1,53 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
 from bestcard.agents.orchestrator import RecommendationOrchestrator
+from bestcard.api.admission import AdmissionLimiter
 from bestcard.config import settings
+from bestcard.repository.fx_store import FxStore
+from bestcard.repository.merchant_store import MerchantStore
 from bestcard.repository.policy_store import PolicyStore
+from bestcard.repository.response_cache import ResponseCache
+from bestcard.repository.user_store import UserStore
 from bestcard.schemas.requests import RecommendRequest
 from bestcard.schemas.responses import RecommendResponse
 
 router = APIRouter(tags=["recommend"])
-orchestrator = RecommendationOrchestrator(PolicyStore(settings.card_policy_file))
+response_cache = None
+if settings.response_cache_max_bytes > 0:
+    response_cache = ResponseCache(
+        settings.response_cache_max_bytes,
+        settings.response_cache_dir or None,
+        settings.response_cache_dir_max_bytes,
+    )
+orchestrator = RecommendationOrchestrator(
+    PolicyStore(settings.card_policy_file),
+    UserStore(settings.user_profile_file),
+    MerchantStore(settings.merchant_dictionary_file, settings.merchant_matcher_file or None),
+    FxStore(settings.fx_rates_file),
+    response_cache,
+)
+llm_limiter = AdmissionLimiter(
+    "message",
+    settings.llm_max_concurrency,
+    settings.llm_max_queue,
+    settings.llm_queue_timeout_s,
+    settings.admission_retry_after_s,
+)
+structured_limiter = AdmissionLimiter(
+    "structured",
+    settings.structured_max_concurrency,
+    settings.structured_max_queue,
+    settings.structured_queue_timeout_s,
+    settings.admission_retry_after_s,
+)
 
 
 @router.post("/recommend", response_model=RecommendResponse)
-def recommend(request: RecommendRequest) -> RecommendResponse:
-    try:
-        return orchestrator.recommend(request)
-    except Exception as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
+async def recommend(request: RecommendRequest) -> RecommendResponse:
+    limiter = llm_limiter if request.message else structured_limiter
+    async with limiter.slot():
+        try:
+            return await run_in_threadpool(orchestrator.recommend, request)
+        except Exception as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -5,6 +5,25 @@ class Settings(BaseSettings):
     app_host: str = "0.0.0.0"
     app_port: int = 8000
     card_policy_file: str = "data/cards/sample_cards.json"
+    user_profile_file: str = "data/users/profiles.json"
+    merchant_dictionary_file: str = "data/merchants/merchants.json"
+    merchant_matcher_file: str = "data/merchants/merchants.matcher"
+    fx_rates_file: str = "data/fx/rates.json"
+
+    llm_max_concurrency: int = 8
+    llm_max_queue: int = 32
+    llm_queue_timeout_s: float = 2.0
+    structured_max_concurrency: int = 16
+    structured_max_queue: int = 64
+    structured_queue_timeout_s: float = 0.5
+    portfolio_max_concurrency: int = 4
+    portfolio_max_queue: int = 8
+    portfolio_queue_timeout_s: float = 1.0
+    admission_retry_after_s: int = 1
+
+    response_cache_max_bytes: int = 32 * 1024 * 1024
+    response_cache_dir: str = ""
+    response_cache_dir_max_bytes: int = 256 * 1024 * 1024
 
     telegram_bot_token: str = ""
     openai_api_key: str = ""
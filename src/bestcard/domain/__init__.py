@@ -1,3 +1,23 @@
-from .models import CardEvaluation, CardPolicy, RewardRule, SpendScenario
+from .models import (
+    CardEvaluation,
+    CardPolicy,
+    CategoryRoute,
+    MerchantEntry,
+    PortfolioResult,
+    RewardRule,
+    SpendProfile,
+    SpendScenario,
+    UserProfile,
+)
 
-__all__ = ["CardEvaluation", "CardPolicy", "RewardRule", "SpendScenario"]
+__all__ = [
+    "CardEvaluation",
+    "CardPolicy",
+    "CategoryRoute",
+    "MerchantEntry",
+    "PortfolioResult",
+    "RewardRule",
+    "SpendProfile",
+    "SpendScenario",
+    "UserProfile",
+]
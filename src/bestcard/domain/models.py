@@ -1,4 +1,7 @@
-from pydantic import BaseModel, Field
+from datetime import date
+from typing import Annotated
+
+from pydantic import BaseModel, Field, model_validator
 
 
 class RewardRule(BaseModel):
@@ -6,11 +9,21 @@ class RewardRule(BaseModel):
     cashback_rate: float
     cap_amount: float | None = None
     cap_period: str | None = None
+    effective_from: date | None = None
+    effective_to: date | None = None
+
+    @model_validator(mode="after")
+    def _check_effective_range(self) -> "RewardRule":
+        start, end = self.effective_from, self.effective_to
+        if start is not None and end is not None and start >= end:
+            raise ValueError("effective_from must be earlier than effective_to.")
+        return self
 
 
 class CardPolicy(BaseModel):
     card_id: str
     card_name: str
+    currency: str = "USD"
     annual_fee: float = 0
     foreign_txn_fee_rate: float = 0
     base_cashback_rate: float = 0
@@ -18,6 +31,18 @@ class CardPolicy(BaseModel):
     notes: str | None = None
 
 
+class MerchantEntry(BaseModel):
+    name: str
+    category: str
+    aliases: list[str] = Field(default_factory=list)
+    mcc: list[str] = Field(default_factory=list)
+
+
+class UserProfile(BaseModel):
+    user_id: str
+    card_ids: list[str] = Field(default_factory=list)
+
+
 class SpendScenario(BaseModel):
     amount: float = Field(gt=0)
     category: str
@@ -25,6 +50,7 @@ class SpendScenario(BaseModel):
     currency: str = "USD"
     include_annual_fee_proration: bool = False
     monthly_spend_estimate: float | None = None
+    transaction_date: date | None = None
 
 
 class CardEvaluation(BaseModel):
@@ -34,3 +60,27 @@ class CardEvaluation(BaseModel):
     fee: float
     net_reward: float
     reasoning: str
+
+
+class SpendProfile(BaseModel):
+    category_spend: dict[str, Annotated[float, Field(ge=0)]]
+    foreign_share: float = Field(default=0, ge=0, le=1)
+    currency: str = "USD"
+
+
+class CategoryRoute(BaseModel):
+    category: str
+    card_id: str
+    yearly_spend: float
+    yearly_net_reward: float
+
+
+class PortfolioResult(BaseModel):
+    card_ids: list[str]
+    yearly_net_reward: float
+    yearly_annual_fee: float
+    currency: str = "USD"
+    routes: list[CategoryRoute]
+    optimal: bool
+    candidates: int
+    nodes_explored: int
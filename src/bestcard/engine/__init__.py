@@ -1,4 +1,16 @@
-from .evaluator import evaluate_card
+from .catalog import CompiledCatalog
+from .evaluator import evaluate_card, score_card
+from .portfolio import optimize_portfolio
+from .replay import replay_transactions
 from .selectors import rank_cards
+from .timeline import CardTimeline
 
-__all__ = ["evaluate_card", "rank_cards"]
+__all__ = [
+    "CardTimeline",
+    "CompiledCatalog",
+    "evaluate_card",
+    "optimize_portfolio",
+    "rank_cards",
+    "replay_transactions",
+    "score_card",
+]
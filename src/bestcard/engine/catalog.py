@@ -0,0 +1,107 @@
+from collections import Counter
+from collections.abc import Iterable
+
+from bestcard.domain.models import CardPolicy, SpendScenario
+from bestcard.engine.timeline import CardTimeline
+
+FrontierKey = tuple[str | None, bool, bool]
+
+
+class CompiledCatalog:
+    """Immutable snapshot of the card policies with bitset-based card selection."""
+
+    def __init__(self, cards: list[CardPolicy], version: str):
+        self.cards = tuple(cards)
+        self.version = version
+        self.index = {card.card_id: position for position, card in enumerate(self.cards)}
+        # Bit ``i`` of a mask refers to ``cards[i]``.
+        self.full_mask = (1 << len(self.cards)) - 1
+
+        # Scenarios are priced in the most common currency; the other groups convert with one factor each.
+        counts = Counter(card.currency.upper() for card in self.cards)
+        self.currencies = frozenset(counts)
+        self.currency = min(counts, key=lambda code: (-counts[code], code)) if counts else "USD"
+        self.timelines = {card.card_id: CardTimeline(card) for card in self.cards}
+
+        self.categories = frozenset(rule.category.lower() for card in self.cards for rule in card.reward_rules)
+        # Pareto-optimal cards per key; ``None`` covers categories no card rewards.
+        self.frontiers: dict[FrontierKey, int] = {
+            (category, is_foreign, proration): self._frontier_mask(category, is_foreign, proration)
+            for category in (*sorted(self.categories), None)
+            for is_foreign in (False, True)
+            for proration in (False, True)
+        }
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def get(self, card_id: str) -> CardPolicy | None:
+        position = self.index.get(card_id)
+        return None if position is None else self.cards[position]
+
+    def mask_for(self, card_ids: Iterable[str]) -> int:
+        mask = 0
+        for card_id in card_ids:
+            position = self.index.get(card_id)
+            if position is not None:
+                mask |= 1 << position
+        return mask
+
+    def select(self, mask: int) -> list[CardPolicy]:
+        selected: list[CardPolicy] = []
+        while mask:
+            lowest = mask & -mask
+            selected.append(self.cards[lowest.bit_length() - 1])
+            mask ^= lowest
+        return selected
+
+    def frontier_key(self, scenario: SpendScenario) -> FrontierKey:
+        category = scenario.category.lower()
+        return (
+            category if category in self.categories else None,
+            scenario.is_foreign,
+            bool(scenario.include_annual_fee_proration and scenario.monthly_spend_estimate),
+        )
+
+    def candidates(self, scenario: SpendScenario) -> list[CardPolicy]:
+        return self.select(self.frontiers[self.frontier_key(scenario)])
+
+    def pruning_stats(self) -> dict[str, int]:
+        stats: dict[str, int] = {}
+        for (category, is_foreign, proration), mask in self.frontiers.items():
+            scope = "foreign" if is_foreign else "domestic"
+            label = f"{category or '*'}:{scope}:{'prorated' if proration else 'plain'}"
+            stats[label] = mask.bit_count()
+        return stats
+
+    def _frontier_mask(self, category: str | None, is_foreign: bool, proration: bool) -> int:
+        # net = amount * (rate - foreign fee) - prorated annual fee, ties broken by cashback
+        # (= amount * rate), so a card is never needed when another one is at least as good
+        # on all three terms. Dated rules make the rate a range: the dominating card's
+        # lowest rate must reach the other card's highest one, which keeps the frontier
+        # valid on every date. Where both can be equal on some date the ranking's stable
+        # sort keeps the earlier card, so an exact tie only prunes the later card.
+        # Fees are only comparable within one currency, so each currency is its own group.
+        points = []
+        for position, card in enumerate(self.cards):
+            low, high = self.timelines[card.card_id].rate_bounds(category)
+            fee_rate = card.foreign_txn_fee_rate if is_foreign else 0.0
+            fixed = card.annual_fee / 12 if proration else 0.0
+            points.append((-(low - fee_rate), fixed, -low, position, -(high - fee_rate), -high))
+        points.sort()
+
+        kept_by_currency: dict[str, list[tuple[float, ...]]] = {}
+        mask = 0
+        for point in points:
+            kept = kept_by_currency.setdefault(self.cards[point[3]].currency.upper(), [])
+            if any(
+                other[0] <= point[4]
+                and other[1] <= point[1]
+                and other[2] <= point[5]
+                and (other[3] < point[3] or other[0] < point[4] or other[1] < point[1] or other[2] < point[5])
+                for other in kept
+            ):
+                continue
+            kept.append(point)
+            mask |= 1 << point[3]
+        return mask
@@ -1,15 +1,47 @@
+from datetime import date
+
 from bestcard.domain.models import CardEvaluation, CardPolicy, SpendScenario
+from bestcard.engine.timeline import CardTimeline, rule_active
 
 
-def _category_rate(card: CardPolicy, category: str) -> tuple[float, str]:
+def _category_rate(card: CardPolicy, category: str, on: date) -> tuple[float, str]:
     for rule in card.reward_rules:
-        if rule.category.lower() == category.lower():
+        if rule.category.lower() == category.lower() and rule_active(rule, on):
             return rule.cashback_rate, f"matched category '{rule.category}'"
     return card.base_cashback_rate, "fallback to base cashback"
 
 
-def evaluate_card(card: CardPolicy, scenario: SpendScenario) -> CardEvaluation:
-    rate, reason = _category_rate(card, scenario.category)
+def _timeline_rate(timeline: CardTimeline, category: str, on: date) -> tuple[float, str]:
+    rule = timeline.rules_on(on).get(category.lower())
+    if rule is not None:
+        return rule.cashback_rate, f"matched category '{rule.category}'"
+    return timeline.card.base_cashback_rate, "fallback to base cashback"
+
+
+def score_card(
+    card: CardPolicy,
+    scenario: SpendScenario,
+    timeline: CardTimeline | None = None,
+    fx_factor: float | None = None,
+) -> tuple[tuple[float, float], CardEvaluation]:
+    """Evaluate one card and return its unrounded ``(net_reward, cashback)`` ranking key.
+
+    ``fx_factor`` converts the card's currency into the scenario's; only the annual
+    fee is an amount in the card's currency, and the factor is required when the
+    currencies differ.
+    """
+    if fx_factor is None:
+        if scenario.currency.upper() != card.currency.upper():
+            raise ValueError(
+                f"Scenario is in {scenario.currency} but card '{card.card_id}' is in {card.currency}; convert it first."
+            )
+        fx_factor = 1.0
+
+    on = scenario.transaction_date or date.today()
+    if timeline is not None:
+        rate, reason = _timeline_rate(timeline, scenario.category, on)
+    else:
+        rate, reason = _category_rate(card, scenario.category, on)
     cashback = scenario.amount * rate
 
     fee = 0.0
@@ -17,14 +49,14 @@ def evaluate_card(card: CardPolicy, scenario: SpendScenario) -> CardEvaluation:
         fee += scenario.amount * card.foreign_txn_fee_rate
 
     if scenario.include_annual_fee_proration and scenario.monthly_spend_estimate:
-        fee += card.annual_fee / 12
+        fee += card.annual_fee * fx_factor / 12
 
     net_reward = cashback - fee
     reasoning = (
         f"rate={rate:.2%} ({reason}), cashback={cashback:.2f}, fee={fee:.2f}, net={net_reward:.2f}"
     )
 
-    return CardEvaluation(
+    evaluation = CardEvaluation(
         card_id=card.card_id,
         card_name=card.card_name,
         cashback=round(cashback, 2),
@@ -32,3 +64,13 @@ def evaluate_card(card: CardPolicy, scenario: SpendScenario) -> CardEvaluation:
         net_reward=round(net_reward, 2),
         reasoning=reasoning,
     )
+    return (net_reward, cashback), evaluation
+
+
+def evaluate_card(
+    card: CardPolicy,
+    scenario: SpendScenario,
+    timeline: CardTimeline | None = None,
+    fx_factor: float | None = None,
+) -> CardEvaluation:
+    return score_card(card, scenario, timeline, fx_factor)[1]
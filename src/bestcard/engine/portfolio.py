@@ -0,0 +1,230 @@
+import time
+from datetime import date
+
+from bestcard.domain.models import CardPolicy, CategoryRoute, PortfolioResult, SpendProfile
+from bestcard.engine.timeline import rule_active
+
+PERIODS_PER_YEAR = {"year": 1, "quarter": 4, "month": 12}
+_DEADLINE_CHECK_INTERVAL = 64
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+def _yearly_category_value(
+    card: CardPolicy,
+    category: str,
+    yearly_spend: float,
+    foreign_share: float,
+    on: date,
+    fx_factor: float = 1.0,
+) -> float:
+    reward = yearly_spend * card.base_cashback_rate
+    for rule in card.reward_rules:
+        if rule.category.lower() == category and rule_active(rule, on):
+            capped_spend = yearly_spend
+            periods = PERIODS_PER_YEAR.get((rule.cap_period or "").lower())
+            if rule.cap_amount and periods:
+                capped_spend = min(yearly_spend, rule.cap_amount * fx_factor * periods)
+            reward = capped_spend * rule.cashback_rate + (yearly_spend - capped_spend) * card.base_cashback_rate
+            break
+    return reward - yearly_spend * foreign_share * card.foreign_txn_fee_rate
+
+
+def _fx_factor(card: CardPolicy, currency: str, fx_factors: dict[str, float] | None) -> float:
+    code = card.currency.upper()
+    if code == currency.upper():
+        return 1.0
+    if fx_factors is None or code not in fx_factors:
+        raise ValueError(f"Profile is in {currency} but card '{card.card_id}' is in {card.currency}; convert it first.")
+    return fx_factors[code]
+
+
+def _prune_dominated(values: list[list[float]], fixed: list[float], deadline: float) -> tuple[list[int], bool]:
+    """Drop cards that another card beats or ties in every category at no higher annual fee.
+
+    Past the deadline the remaining cards are kept unchecked and ``False`` is returned.
+    """
+    if time.perf_counter() > deadline:
+        return list(range(len(values))), False
+    order = sorted(range(len(values)), key=lambda i: (-sum(values[i]), fixed[i], i))
+    kept: list[int] = []
+    for position, j in enumerate(order):
+        if time.perf_counter() > deadline:
+            return kept + order[position:], False
+        dominated = any(
+            fixed[i] <= fixed[j] and all(vi >= vj for vi, vj in zip(values[i], values[j])) for i in kept
+        )
+        if not dominated:
+            kept.append(j)
+    return kept, True
+
+
+class _Search:
+    def __init__(self, values: list[list[float]], fixed: list[float], k: int, deadline: float):
+        self.values = values
+        self.fixed = fixed
+        self.k = k
+        self.deadline = deadline
+        self.best_value = float("-inf")
+        self.best_set: tuple[int, ...] = ()
+        self.nodes = 0
+
+    def _gain(self, j: int, current: list[float]) -> float:
+        return sum(max(0.0, v - c) for v, c in zip(self.values[j], current)) - self.fixed[j]
+
+    def _record(self, chosen: tuple[int, ...], value: float) -> None:
+        if value > self.best_value + 1e-9:
+            self.best_value = value
+            self.best_set = chosen
+
+    def greedy(self) -> None:
+        n = len(self.values)
+        first = max(range(n), key=lambda i: sum(self.values[i]) - self.fixed[i])
+        chosen = [first]
+        current = list(self.values[first])
+        value = sum(current) - self.fixed[first]
+        self._record((first,), value)
+        while len(chosen) < self.k:
+            best: tuple[float, int] | None = None
+            for j in range(n):
+                if j % _DEADLINE_CHECK_INTERVAL == 0 and time.perf_counter() > self.deadline:
+                    raise _BudgetExceeded
+                if j not in chosen:
+                    candidate = (self._gain(j, current), j)
+                    if best is None or candidate > best:
+                        best = candidate
+            if best is None:
+                break
+            gain, j = best
+            if gain <= 0:
+                break
+            chosen.append(j)
+            current = [max(c, v) for c, v in zip(current, self.values[j])]
+            value += gain
+            self._record(tuple(sorted(chosen)), value)
+
+    def run(self) -> None:
+        # Shift every category so values are non-negative; coverage is then subadditive and
+        # singleton scores bound any set that starts at a given root.
+        floors = [min(0.0, *column) for column in zip(*self.values)]
+        floor_total = sum(floors)
+        singles = [sum(v - f for v, f in zip(row, floors)) - fee for row, fee in zip(self.values, self.fixed)]
+        pool = sorted(range(len(self.values)), key=lambda i: singles[i], reverse=True)
+
+        for position, first in enumerate(pool):
+            rest = [singles[j] for j in pool[position + 1 : position + self.k] if singles[j] > 0]
+            if floor_total + singles[first] + sum(rest) <= self.best_value + 1e-9:
+                break
+            current = list(self.values[first])
+            self._branch((first,), current, sum(current) - self.fixed[first], pool[position + 1 :])
+
+    def _branch(self, chosen: tuple[int, ...], current: list[float], value: float, pool: list[int]) -> None:
+        self.nodes += 1
+        if time.perf_counter() > self.deadline:
+            raise _BudgetExceeded
+        self._record(chosen, value)
+
+        slots = self.k - len(chosen)
+        if slots == 0:
+            return
+
+        # Marginal gains only shrink as the set grows, so non-positive cards never help deeper down.
+        gains = sorted(
+            ((gain, j) for j in pool if (gain := self._gain(j, current)) > 0),
+            reverse=True,
+        )
+        for position, (gain, j) in enumerate(gains):
+            bound = value + sum(g for g, _ in gains[position : position + slots])
+            if bound <= self.best_value + 1e-9:
+                break
+            next_current = [max(c, v) for c, v in zip(current, self.values[j])]
+            self._branch(chosen + (j,), next_current, value + gain, [i for _, i in gains[position + 1 :]])
+
+
+def optimize_portfolio(
+    cards: list[CardPolicy],
+    profile: SpendProfile,
+    k: int,
+    time_budget_s: float = 0.5,
+    on: date | None = None,
+    fx_factors: dict[str, float] | None = None,
+) -> PortfolioResult:
+    """Pick at most ``k`` cards maximizing yearly net reward for the spend profile.
+
+    ``time_budget_s`` covers the whole call: valuation, dominance pruning, the
+    greedy seed and branch-and-bound. When it runs out the best portfolio found
+    so far is returned with ``optimal=False``. Valuation stops early too, so only
+    the cards valued before the deadline (at least the first batch) are considered;
+    the best of those as a single card is always returned. Caps and annual fees of
+    cards in another currency are converted with ``fx_factors`` (card currency to
+    profile currency).
+    """
+    deadline = time.perf_counter() + time_budget_s
+    if not cards:
+        raise ValueError("No cards available.")
+    if k < 1:
+        raise ValueError("k must be at least 1.")
+
+    categories = sorted({category.lower() for category in profile.category_spend})
+    if not categories:
+        raise ValueError("category_spend must contain at least one category.")
+
+    yearly_spend = {category: 0.0 for category in categories}
+    for category, monthly in profile.category_spend.items():
+        yearly_spend[category.lower()] += monthly * 12
+
+    on = on or date.today()
+    factors = [_fx_factor(card, profile.currency, fx_factors) for card in cards]
+    all_values: list[list[float]] = []
+    for position, (card, factor) in enumerate(zip(cards, factors)):
+        if position and position % _DEADLINE_CHECK_INTERVAL == 0 and time.perf_counter() > deadline:
+            break
+        all_values.append(
+            [
+                _yearly_category_value(card, category, yearly_spend[category], profile.foreign_share, on, factor)
+                for category in categories
+            ]
+        )
+    valued = len(all_values) == len(cards)
+    cards = cards[: len(all_values)]
+    all_fixed = [card.annual_fee * factor for card, factor in zip(cards, factors)]
+
+    candidates, pruned = _prune_dominated(all_values, all_fixed, deadline)
+    if pruned:
+        candidates.sort(key=lambda i: sum(all_values[i]) - all_fixed[i], reverse=True)
+    values = [all_values[i] for i in candidates]
+    fixed = [all_fixed[i] for i in candidates]
+
+    search = _Search(values, fixed, min(k, len(candidates)), deadline)
+    optimal = valued and pruned
+    try:
+        search.greedy()
+        search.run()
+    except _BudgetExceeded:
+        optimal = False
+
+    chosen = [candidates[i] for i in search.best_set]
+    routes = []
+    for position, category in enumerate(categories):
+        best = max(chosen, key=lambda i: all_values[i][position])
+        routes.append(
+            CategoryRoute(
+                category=category,
+                card_id=cards[best].card_id,
+                yearly_spend=round(yearly_spend[category], 2),
+                yearly_net_reward=round(all_values[best][position], 2),
+            )
+        )
+
+    return PortfolioResult(
+        card_ids=[cards[i].card_id for i in chosen],
+        yearly_net_reward=round(search.best_value, 2),
+        yearly_annual_fee=round(sum(all_fixed[i] for i in chosen), 2),
+        currency=profile.currency.upper(),
+        routes=routes,
+        optimal=optimal,
+        candidates=len(candidates),
+        nodes_explored=search.nodes,
+    )
@@ -0,0 +1,24 @@
+from collections.abc import Iterable, Iterator
+
+from bestcard.domain.models import CardEvaluation, SpendScenario
+from bestcard.engine.catalog import CompiledCatalog
+from bestcard.engine.selectors import rank_cards
+
+
+def replay_transactions(
+    catalog: CompiledCatalog,
+    scenarios: Iterable[SpendScenario],
+    fx_factors: dict[str, float] | None = None,
+) -> Iterator[CardEvaluation]:
+    """Yield the best card for each dated transaction, using the rules in effect on that date.
+
+    Rows stream through one compiled catalog, so its frontiers and timelines are
+    built once however long the history is. Scenarios must already be in
+    ``catalog.currency`` (see ``FxSnapshot.convert_many`` for batches); cards in
+    other currencies need ``fx_factors`` as in ``rank_cards``.
+    """
+    for scenario in scenarios:
+        ranked = rank_cards(catalog, scenario, fx_factors=fx_factors)
+        if not ranked:
+            raise ValueError("No cards available.")
+        yield ranked[0]
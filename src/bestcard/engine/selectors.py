@@ -1,8 +1,30 @@
 from bestcard.domain.models import CardEvaluation, CardPolicy, SpendScenario
-from bestcard.engine.evaluator import evaluate_card
+from bestcard.engine.catalog import CompiledCatalog
+from bestcard.engine.evaluator import score_card
 
 
-def rank_cards(cards: list[CardPolicy], scenario: SpendScenario) -> list[CardEvaluation]:
-    evaluations = [evaluate_card(card, scenario) for card in cards]
-    evaluations.sort(key=lambda item: (item.net_reward, item.cashback), reverse=True)
-    return evaluations
+def rank_cards(
+    cards: list[CardPolicy] | CompiledCatalog,
+    scenario: SpendScenario,
+    full_ranking: bool = False,
+    fx_factors: dict[str, float] | None = None,
+) -> list[CardEvaluation]:
+    """Rank cards by net reward.
+
+    A compiled catalog is narrowed to the Pareto candidates for the scenario, which
+    always contain the best card; pass ``full_ranking=True`` to rank every card.
+    ``fx_factors`` maps each card currency to its factor into the scenario currency.
+    """
+    fx_factors = fx_factors or {}
+    timelines = {}
+    if isinstance(cards, CompiledCatalog):
+        timelines = cards.timelines
+        cards = list(cards.cards) if full_ranking else cards.candidates(scenario)
+
+    # Sort on the exact values; the evaluations themselves are rounded for display.
+    scored = [
+        score_card(card, scenario, timelines.get(card.card_id), fx_factors.get(card.currency.upper()))
+        for card in cards
+    ]
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [evaluation for _, evaluation in scored]
@@ -0,0 +1,49 @@
+from bisect import bisect_right
+from datetime import date
+
+from bestcard.domain.models import CardPolicy, RewardRule
+
+
+def rule_active(rule: RewardRule, on: date) -> bool:
+    if rule.effective_from is not None and on < rule.effective_from:
+        return False
+    if rule.effective_to is not None and on >= rule.effective_to:
+        return False
+    return True
+
+
+class CardTimeline:
+    """Effective-date index over one card's reward rules.
+
+    Rule boundaries split time into intervals with a constant active rule set;
+    ``rules_on`` bisects the sorted boundaries, so a lookup costs O(log V).
+    """
+
+    def __init__(self, card: CardPolicy):
+        self.card = card
+        self.boundaries = sorted(
+            {day for rule in card.reward_rules for day in (rule.effective_from, rule.effective_to) if day is not None}
+        )
+        self.tables: list[dict[str, RewardRule]] = []
+        for position in range(len(self.boundaries) + 1):
+            table: dict[str, RewardRule] = {}
+            for rule in card.reward_rules:
+                if self._active_in(rule, position):
+                    table.setdefault(rule.category.lower(), rule)
+            self.tables.append(table)
+
+    def _active_in(self, rule: RewardRule, position: int) -> bool:
+        if position == 0:
+            return rule.effective_from is None
+        return rule_active(rule, self.boundaries[position - 1])
+
+    def rules_on(self, on: date) -> dict[str, RewardRule]:
+        return self.tables[bisect_right(self.boundaries, on)]
+
+    def rate_bounds(self, category: str | None) -> tuple[float, float]:
+        """Lowest and highest cashback rate the category ever earns on this card."""
+        base = self.card.base_cashback_rate
+        if category is None:
+            return base, base
+        rates = [table[category].cashback_rate if category in table else base for table in self.tables]
+        return min(rates), max(rates)
@@ -1,22 +1,35 @@
 import asyncio
+import difflib
 
 from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters
 
 from bestcard.agents.orchestrator import RecommendationOrchestrator
 from bestcard.config import settings
+from bestcard.domain.models import UserProfile
+from bestcard.repository.fx_store import FxStore
+from bestcard.repository.merchant_store import MerchantStore
 from bestcard.repository.policy_store import PolicyStore
+from bestcard.repository.user_store import UserStore
 from bestcard.schemas.requests import RecommendRequest
 
-orchestrator = RecommendationOrchestrator(PolicyStore(settings.card_policy_file))
+policy_store = PolicyStore(settings.card_policy_file)
+user_store = UserStore(settings.user_profile_file)
+merchant_store = MerchantStore(settings.merchant_dictionary_file, settings.merchant_matcher_file or None)
+orchestrator = RecommendationOrchestrator(policy_store, user_store, merchant_store, FxStore(settings.fx_rates_file))
+
+# Keeps card listings well under Telegram's 4096-character message limit.
+MAX_LISTED_CARDS = 20
 
 
 def _format_reply(payload) -> str:
     best = payload.best_card
+    scenario = payload.parsed_scenario
+    currency = payload.priced_scenario.currency
     lines = [
         f"Best card: {best.card_name}",
-        f"Net reward: ${best.net_reward:.2f} (cashback ${best.cashback:.2f}, fee ${best.fee:.2f})",
-        f"Scenario: {payload.parsed_scenario.amount:.2f} / {payload.parsed_scenario.category}",
+        f"Net reward: {best.net_reward:.2f} {currency} (cashback {best.cashback:.2f}, fee {best.fee:.2f})",
+        f"Scenario: {scenario.amount:.2f} {scenario.currency} / {scenario.category}",
     ]
     if payload.policy_evidence:
         lines.append("Evidence:")
@@ -25,13 +38,64 @@ def _format_reply(payload) -> str:
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    await update.message.reply_text("Send your spend scenario, e.g. '今晚超市买200刀，哪张卡最好？'")
+    await update.message.reply_text(
+        "Send your spend scenario, e.g. '今晚超市买200刀，哪张卡最好？'\n"
+        "Use /wallet <card_id> ... to recommend only from the cards you hold, "
+        "and /cards <keyword> to look up card ids."
+    )
+
+
+async def cards(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    keyword = " ".join(context.args).lower()
+    matches = [
+        f"{card.card_id} ({card.card_name})"
+        for card in policy_store.load_catalog().cards
+        if keyword in card.card_id.lower() or keyword in card.card_name.lower()
+    ]
+    if not matches:
+        await update.message.reply_text(f"No card matches '{keyword}'.")
+        return
+    lines = matches[:MAX_LISTED_CARDS]
+    if len(matches) > MAX_LISTED_CARDS:
+        lines.append(f"... and {len(matches) - MAX_LISTED_CARDS} more, narrow it down with /cards <keyword>")
+    await update.message.reply_text("\n".join(lines))
+
+
+async def wallet(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    user_id = str(update.effective_user.id)
+    if not context.args:
+        profile = user_store.get_profile(user_id)
+        if profile is None or not profile.card_ids:
+            await update.message.reply_text("Your wallet is empty, recommending from all cards.")
+        else:
+            await update.message.reply_text(f"Your wallet: {', '.join(profile.card_ids)}")
+        return
+
+    catalog = policy_store.load_catalog()
+    unknown = [card_id for card_id in context.args if catalog.get(card_id) is None]
+    if unknown:
+        lines = [f"Unknown card id(s): {', '.join(unknown[:MAX_LISTED_CARDS])}"]
+        suggestions = {
+            match
+            for card_id in unknown[:MAX_LISTED_CARDS]
+            for match in difflib.get_close_matches(card_id, catalog.index)
+        }
+        if suggestions:
+            lines.append(f"Did you mean: {', '.join(sorted(suggestions)[:MAX_LISTED_CARDS])}")
+        lines.append("Use /cards <keyword> to look up card ids.")
+        await update.message.reply_text("\n".join(lines))
+        return
+
+    card_ids = list(dict.fromkeys(context.args))
+    user_store.save_profile(UserProfile(user_id=user_id, card_ids=card_ids))
+    await update.message.reply_text(f"Wallet saved: {', '.join(card_ids)}")
 
 
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     text = update.message.text or ""
     try:
-        result = orchestrator.recommend(RecommendRequest(message=text))
+        request = RecommendRequest(message=text, user_id=str(update.effective_user.id))
+        result = orchestrator.recommend(request)
         await update.message.reply_text(_format_reply(result))
     except Exception as exc:
         await update.message.reply_text(f"Parse failed: {exc}")
@@ -41,8 +105,11 @@ def main() -> None:
     if not settings.telegram_bot_token:
         raise ValueError("TELEGRAM_BOT_TOKEN is required.")
 
+    merchant_store.load_matcher()
     app = Application.builder().token(settings.telegram_bot_token).build()
     app.add_handler(CommandHandler("start", start))
+    app.add_handler(CommandHandler("wallet", wallet))
+    app.add_handler(CommandHandler("cards", cards))
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
 
     app.run_polling()
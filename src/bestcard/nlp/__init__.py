@@ -1,3 +1,4 @@
+from .merchants import MerchantMatch, MerchantMatcher
 from .parser import parse_scenario
 
-__all__ = ["parse_scenario"]
+__all__ = ["MerchantMatch", "MerchantMatcher", "parse_scenario"]
@@ -0,0 +1,220 @@
+import json
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from bestcard.domain.models import MerchantEntry
+
+# Transitions are keyed by (state << 21) | code point (Unicode fits in 21 bits) and stored
+# as two sorted arrays, so the automaton stays compact and can be saved byte for byte.
+_CHAR_BITS = 21
+_FORMAT = 1
+_HEADER = struct.Struct("<Q")
+_ARRAYS = (
+    ("_keys", "q"),
+    ("_targets", "i"),
+    ("_fail", "i"),
+    ("_output", "i"),
+    ("_link", "i"),
+    ("_pattern_merchant", "i"),
+    ("_pattern_length", "i"),
+)
+_MCC_PATTERN = re.compile(r"\bmcc\s*[:#]?\s*(\d{4})\b", re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class MerchantMatch:
+    merchant: str
+    category: str
+    start: int
+    end: int
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+class MerchantMatcher:
+    """Aho-Corasick automaton over merchant names and aliases.
+
+    One linear scan of the text reports every dictionary pattern it contains.
+    Patterns that start or end with an ASCII letter/digit must sit on a word
+    boundary, so short aliases do not fire inside longer English words.
+    """
+
+    def __init__(self, entries: Iterable[MerchantEntry]):
+        self.merchants: list[str] = []
+        self.categories: list[str] = []
+        self.mcc: dict[str, int] = {}
+        pattern_merchant: list[int] = []
+        pattern_length: list[int] = []
+
+        goto: dict[int, int] = {}
+        terminal: dict[int, int] = {}
+        parent = array("i", [0])
+        code_of = array("i", [0])
+        depth = array("i", [0])
+
+        for entry in entries:
+            merchant_id = len(self.merchants)
+            self.merchants.append(entry.name)
+            self.categories.append(entry.category.lower())
+            for code in entry.mcc:
+                self.mcc.setdefault(code, merchant_id)
+
+            for pattern in (entry.name, *entry.aliases):
+                pattern = pattern.casefold().strip()
+                if not pattern:
+                    continue
+                state = 0
+                for ch in pattern:
+                    key = (state << _CHAR_BITS) | ord(ch)
+                    nxt = goto.get(key)
+                    if nxt is None:
+                        nxt = len(parent)
+                        goto[key] = nxt
+                        parent.append(state)
+                        code_of.append(ord(ch))
+                        depth.append(depth[state] + 1)
+                    state = nxt
+                if state not in terminal:
+                    terminal[state] = len(pattern_merchant)
+                    pattern_merchant.append(merchant_id)
+                    pattern_length.append(len(pattern))
+
+        size = len(parent)
+        fail = array("i", bytes(4 * size))
+        output = array("i", [-1]) * size
+        link = array("i", bytes(4 * size))
+        for state, pattern_id in terminal.items():
+            output[state] = pattern_id
+
+        # Breadth-first order guarantees a node's failure target is resolved before the node.
+        for state in sorted(range(1, size), key=depth.__getitem__):
+            if depth[state] == 1:
+                continue
+            code = code_of[state]
+            fallback = fail[parent[state]]
+            while True:
+                nxt = goto.get((fallback << _CHAR_BITS) | code)
+                if nxt is not None or fallback == 0:
+                    break
+                fallback = fail[fallback]
+            target = nxt if nxt is not None else 0
+            fail[state] = target
+            link[state] = target if output[target] >= 0 else link[target]
+
+        keys = sorted(goto)
+        self._keys = array("q", keys)
+        self._targets = array("i", [goto[key] for key in keys])
+        self._fail = fail
+        self._output = output
+        self._link = link
+        self._pattern_merchant = array("i", pattern_merchant)
+        self._pattern_length = array("i", pattern_length)
+
+    def __len__(self) -> int:
+        return len(self._pattern_length)
+
+    def to_bytes(self, tag: str) -> bytes:
+        """Serialize the compiled automaton; ``tag`` identifies the source it was built from."""
+        header = json.dumps(
+            {
+                "format": _FORMAT,
+                "byteorder": sys.byteorder,
+                "tag": tag,
+                "merchants": self.merchants,
+                "categories": self.categories,
+                "mcc": self.mcc,
+                "lengths": [len(getattr(self, name)) for name, _ in _ARRAYS],
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        return b"".join([_HEADER.pack(len(header)), header, *(getattr(self, name).tobytes() for name, _ in _ARRAYS)])
+
+    @classmethod
+    def from_bytes(cls, data: bytes, tag: str) -> "MerchantMatcher":
+        """Load an automaton saved by ``to_bytes``; raises ValueError unless it was built from ``tag``."""
+        try:
+            (size,) = _HEADER.unpack_from(data)
+            header = json.loads(data[_HEADER.size : _HEADER.size + size])
+        except (struct.error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise ValueError("Not a compiled merchant matcher.") from exc
+        if header.get("format") != _FORMAT or header.get("byteorder") != sys.byteorder or header.get("tag") != tag:
+            raise ValueError("Compiled merchant matcher is stale or from another platform.")
+
+        matcher = cls.__new__(cls)
+        matcher.merchants = header["merchants"]
+        matcher.categories = header["categories"]
+        matcher.mcc = header["mcc"]
+        view = memoryview(data)
+        offset = _HEADER.size + size
+        for (name, typecode), length in zip(_ARRAYS, header["lengths"]):
+            values = array(typecode)
+            end = offset + length * values.itemsize
+            if end > len(data):
+                raise ValueError("Compiled merchant matcher is truncated.")
+            values.frombytes(view[offset:end])
+            setattr(matcher, name, values)
+            offset = end
+        return matcher
+
+    def find_all(self, text: str) -> list[MerchantMatch]:
+        keys, targets, fail, output, link = self._keys, self._targets, self._fail, self._output, self._link
+        size = len(keys)
+        folded = text.casefold()
+        matches: list[MerchantMatch] = []
+        state = 0
+        for end, ch in enumerate(folded, start=1):
+            code = ord(ch)
+            while True:
+                key = (state << _CHAR_BITS) | code
+                position = bisect_left(keys, key)
+                if position < size and keys[position] == key:
+                    state = targets[position]
+                    break
+                if state == 0:
+                    break
+                state = fail[state]
+
+            node = state if output[state] >= 0 else link[state]
+            while node:
+                pattern_id = output[node]
+                start = end - self._pattern_length[pattern_id]
+                if self._on_boundary(folded, start, end):
+                    merchant_id = self._pattern_merchant[pattern_id]
+                    matches.append(
+                        MerchantMatch(self.merchants[merchant_id], self.categories[merchant_id], start, end)
+                    )
+                node = link[node]
+        return matches
+
+    def resolve(self, text: str, mcc: str | None = None) -> MerchantMatch | None:
+        """Return the most specific merchant in ``text``; an MCC code takes precedence."""
+        code = mcc
+        if code is None:
+            found = _MCC_PATTERN.search(text)
+            code = found.group(1) if found else None
+        if code is not None and code in self.mcc:
+            merchant_id = self.mcc[code]
+            return MerchantMatch(self.merchants[merchant_id], self.categories[merchant_id], -1, -1)
+
+        matches = self.find_all(text)
+        if not matches:
+            return None
+        return max(matches, key=lambda match: (match.end - match.start, -match.start))
+
+    def resolve_many(self, rows: Iterable[str]) -> list[MerchantMatch | None]:
+        return [self.resolve(row) for row in rows]
+
+    @staticmethod
+    def _on_boundary(text: str, start: int, end: int) -> bool:
+        if _is_word_char(text[start]) and start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if _is_word_char(text[end - 1]) and end < len(text) and _is_word_char(text[end]):
+            return False
+        return True
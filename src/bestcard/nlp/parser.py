@@ -1,5 +1,6 @@
 import json
 import os
+from datetime import date
 
 from bestcard.domain.models import SpendScenario
 
@@ -23,7 +24,8 @@ def _llm_extract_scenario(message: str, fallback_currency: str) -> dict:
         raise ScenarioParseError("OPENAI_API_KEY is missing for LLM parser.")
 
     model = os.getenv("OPENAI_MODEL", "gpt-4.1-mini").strip()
-    client = OpenAI(api_key=api_key)
+    timeout = float(os.getenv("OPENAI_TIMEOUT_S", "20"))
+    client = OpenAI(api_key=api_key, timeout=timeout, max_retries=1)
 
     system_prompt = (
         "Extract a spending scenario from user message. "
@@ -63,11 +65,12 @@ def parse_scenario(
     amount: float | None = None,
     category: str | None = None,
     is_foreign: bool | None = None,
-    currency: str = "USD",
+    currency: str | None = None,
     include_annual_fee_proration: bool = False,
     monthly_spend_estimate: float | None = None,
+    transaction_date: date | None = None,
 ) -> SpendScenario:
-    llm_result = _llm_extract_scenario(message=message, fallback_currency=currency)
+    llm_result = _llm_extract_scenario(message=message, fallback_currency=currency or "USD")
 
     parsed_amount = amount if amount is not None else llm_result.get("amount")
     if parsed_amount is None or float(parsed_amount) <= 0:
@@ -79,7 +82,7 @@ def parse_scenario(
 
     parsed_foreign = is_foreign if is_foreign is not None else bool(llm_result.get("is_foreign", False))
 
-    parsed_currency = currency or str(llm_result.get("currency", "USD")).upper()
+    parsed_currency = (currency or str(llm_result.get("currency") or "USD")).upper()
     parsed_include_proration = (
         include_annual_fee_proration
         if include_annual_fee_proration
@@ -101,4 +104,5 @@ def parse_scenario(
         currency=parsed_currency,
         include_annual_fee_proration=parsed_include_proration,
         monthly_spend_estimate=parsed_monthly_spend,
+        transaction_date=transaction_date,
     )
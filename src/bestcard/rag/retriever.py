@@ -1,14 +1,20 @@
+from datetime import date
+
 from bestcard.domain.models import CardPolicy
+from bestcard.engine.timeline import rule_active
 
 
-def retrieve_policy_evidence(card: CardPolicy, category: str) -> list[str]:
+def retrieve_policy_evidence(card: CardPolicy, category: str, on: date | None = None) -> list[str]:
     snippets: list[str] = []
+    on = on or date.today()
 
     for rule in card.reward_rules:
-        if rule.category.lower() == category.lower():
+        if rule.category.lower() == category.lower() and rule_active(rule, on):
             line = f"{card.card_name}: {rule.category} cashback {rule.cashback_rate:.0%}"
             if rule.cap_amount and rule.cap_period:
                 line += f" (cap {rule.cap_amount:.0f}/{rule.cap_period})"
+            if rule.effective_from or rule.effective_to:
+                line += f" (effective {rule.effective_from or '...'} to {rule.effective_to or '...'})"
             snippets.append(line)
 
     if card.foreign_txn_fee_rate > 0:
@@ -1,3 +1,7 @@
+from .fx_store import FxSnapshot, FxStore
+from .merchant_store import MerchantStore
 from .policy_store import PolicyStore
+from .response_cache import ResponseCache
+from .user_store import UserStore
 
-__all__ = ["PolicyStore"]
+__all__ = ["FxSnapshot", "FxStore", "MerchantStore", "PolicyStore", "ResponseCache", "UserStore"]
@@ -0,0 +1,95 @@
+import hashlib
+import json
+import logging
+import math
+from collections.abc import Sequence
+from pathlib import Path
+
+from bestcard.domain.models import SpendProfile, SpendScenario
+from bestcard.repository.reloading_file import ReloadingFile
+
+logger = logging.getLogger(__name__)
+
+
+class FxSnapshot:
+    """Immutable FX table: ``rates[code]`` is the number of ``code`` units per one ``base`` unit."""
+
+    def __init__(self, base: str, rates: dict[str, float], version: str):
+        self.base = base.upper()
+        self.rates = {code.upper(): float(rate) for code, rate in rates.items()}
+        invalid = sorted(code for code, rate in self.rates.items() if not math.isfinite(rate) or rate <= 0)
+        if invalid:
+            raise ValueError(f"FX snapshot {version} has non-positive rates for {', '.join(invalid)}.")
+        self.rates[self.base] = 1.0
+        self.version = version
+        self._factors: dict[tuple[str, str], float] = {}
+
+    def factor(self, source: str, target: str) -> float:
+        """Multiplier converting an amount in ``source`` into ``target``, cached per pair."""
+        key = (source.upper(), target.upper())
+        factor = self._factors.get(key)
+        if factor is None:
+            if key[0] == key[1]:
+                factor = 1.0
+            else:
+                missing = [code for code in key if code not in self.rates]
+                if missing:
+                    raise ValueError(f"No FX rate for {', '.join(missing)} in snapshot {self.version}.")
+                factor = self.rates[key[1]] / self.rates[key[0]]
+            self._factors[key] = factor
+        return factor
+
+    def convert(self, amount: float, source: str, target: str) -> float:
+        return amount * self.factor(source, target)
+
+    def convert_many(self, amounts: Sequence[float], currencies: Sequence[str], target: str) -> list[float]:
+        if len(amounts) != len(currencies):
+            raise ValueError("amounts and currencies must have the same length.")
+        factors = {currency: self.factor(currency, target) for currency in set(currencies)}
+        return [amount * factors[currency] for amount, currency in zip(amounts, currencies)]
+
+    def convert_scenario(self, scenario: SpendScenario, target: str) -> SpendScenario:
+        if scenario.currency.upper() == target.upper():
+            return scenario
+        factor = self.factor(scenario.currency, target)
+        monthly = scenario.monthly_spend_estimate
+        return scenario.model_copy(
+            update={
+                "amount": scenario.amount * factor,
+                "currency": target.upper(),
+                "monthly_spend_estimate": None if monthly is None else monthly * factor,
+            }
+        )
+
+    def convert_profile(self, profile: SpendProfile, target: str) -> SpendProfile:
+        factor = self.factor(profile.currency, target)
+        return profile.model_copy(
+            update={
+                "category_spend": {category: spend * factor for category, spend in profile.category_spend.items()},
+                "currency": target.upper(),
+            }
+        )
+
+
+class FxStore:
+    def __init__(self, rates_file: str, base_currency: str = "USD"):
+        self.rates_file = Path(rates_file)
+        self.base_currency = base_currency
+        self._snapshot = ReloadingFile(self.rates_file, self._parse, missing=self._empty)
+
+    def load_snapshot(self) -> FxSnapshot:
+        """Return the FX snapshot, re-reading the rates file only when it changed.
+
+        Without a rates file only same-currency conversions succeed.
+        """
+        return self._snapshot.get()
+
+    def _empty(self) -> FxSnapshot:
+        return FxSnapshot(self.base_currency, {}, "none")
+
+    def _parse(self, raw: bytes) -> FxSnapshot:
+        data = json.loads(raw)
+        version = f"{data.get('as_of', 'unknown')}-{hashlib.sha256(raw).hexdigest()[:8]}"
+        snapshot = FxSnapshot(data.get("base", self.base_currency), data.get("rates", {}), version)
+        logger.info("Loaded FX snapshot %s: %d currencies", version, len(snapshot.rates))
+        return snapshot
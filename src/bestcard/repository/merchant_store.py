@@ -0,0 +1,82 @@
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from pydantic import TypeAdapter
+
+from bestcard.domain.models import MerchantEntry
+from bestcard.nlp.merchants import MerchantMatcher
+from bestcard.nlp.parser import ALLOWED_CATEGORIES
+from bestcard.repository.reloading_file import ReloadingFile
+
+logger = logging.getLogger(__name__)
+
+_ENTRIES = TypeAdapter(list[MerchantEntry])
+
+
+class MerchantStore:
+    def __init__(self, dictionary_file: str, compiled_file: str | None = None):
+        self.dictionary_file = Path(dictionary_file)
+        self.compiled_file = Path(compiled_file) if compiled_file else None
+        self._matcher = ReloadingFile(
+            self.dictionary_file,
+            self._compile,
+            missing=lambda: MerchantMatcher([]),
+            keep_last_good=True,
+            background=True,
+        )
+
+    def load_matcher(self) -> MerchantMatcher:
+        """Return the compiled matcher, rebuilding it only when the dictionary file changed.
+
+        A missing dictionary yields an empty matcher so merchant resolution stays optional.
+        A dictionary that fails to load is logged once and the last good matcher (or an
+        empty one) keeps serving until the file changes again. Only the first call builds
+        on the caller's thread; later changes are rebuilt in the background and swapped in.
+        """
+        return self._matcher.get()
+
+    def _compile(self, raw: bytes) -> MerchantMatcher:
+        tag = hashlib.sha256(raw).hexdigest()
+        matcher = self._load_compiled(tag)
+        if matcher is not None:
+            logger.info("Loaded compiled merchant matcher %s: %d patterns", self.compiled_file, len(matcher))
+            return matcher
+
+        entries = _ENTRIES.validate_json(raw)
+        invalid = [entry.name for entry in entries if entry.category.lower() not in ALLOWED_CATEGORIES]
+        if invalid:
+            raise ValueError(
+                f"Merchant entries with unknown categories: {', '.join(invalid)}; "
+                f"category must be one of: {', '.join(ALLOWED_CATEGORIES)}."
+            )
+        matcher = MerchantMatcher(entries)
+        logger.info("Loaded merchant dictionary: %d merchants, %d patterns", len(entries), len(matcher))
+        self._save_compiled(matcher, tag)
+        return matcher
+
+    def _load_compiled(self, tag: str) -> MerchantMatcher | None:
+        if self.compiled_file is None:
+            return None
+        try:
+            return MerchantMatcher.from_bytes(self.compiled_file.read_bytes(), tag)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.info("Rebuilding merchant matcher, compiled file unusable: %s", exc)
+            return None
+
+    def _save_compiled(self, matcher: MerchantMatcher, tag: str) -> None:
+        if self.compiled_file is None:
+            return
+        try:
+            self.compiled_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="wb", dir=self.compiled_file.parent, suffix=".tmp", delete=False
+            ) as fp:
+                fp.write(matcher.to_bytes(tag))
+            os.replace(fp.name, self.compiled_file)
+        except OSError:
+            logger.warning("Cannot save compiled merchant matcher to %s", self.compiled_file, exc_info=True)
@@ -1,12 +1,19 @@
+import hashlib
 import json
+import logging
 from pathlib import Path
 
 from bestcard.domain.models import CardPolicy
+from bestcard.engine.catalog import CompiledCatalog
+from bestcard.repository.reloading_file import ReloadingFile
+
+logger = logging.getLogger(__name__)
 
 
 class PolicyStore:
     def __init__(self, policy_file: str):
         self.policy_file = Path(policy_file)
+        self._catalog = ReloadingFile(self.policy_file, self._compile, keep_last_good=True)
 
     def load_cards(self) -> list[CardPolicy]:
         if not self.policy_file.exists():
@@ -16,3 +23,28 @@ class PolicyStore:
             data = json.load(fh)
 
         return [CardPolicy.model_validate(item) for item in data]
+
+    def load_catalog(self) -> CompiledCatalog:
+        """Return the compiled catalog, recompiling only when the policy file changed.
+
+        A policy edit that fails to compile is logged and the last good catalog keeps serving.
+        """
+        if not self.policy_file.exists():
+            raise FileNotFoundError(f"Policy file not found: {self.policy_file}")
+        return self._catalog.get()
+
+    @staticmethod
+    def _compile(raw: bytes) -> CompiledCatalog:
+        cards = [CardPolicy.model_validate(item) for item in json.loads(raw)]
+        version = hashlib.sha256(raw).hexdigest()[:12]
+        catalog = CompiledCatalog(cards, version)
+        stats = catalog.pruning_stats()
+        logger.info(
+            "Loaded policy snapshot %s: %d cards, %d-%d Pareto candidates per key %s",
+            version,
+            len(cards),
+            min(stats.values(), default=0),
+            max(stats.values(), default=0),
+            stats,
+        )
+        return catalog
@@ -0,0 +1,113 @@
+import logging
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Stamp = tuple[int, int]
+
+
+class ReloadingFile(Generic[T]):
+    """Value built from a file, rebuilt only when its ``(mtime_ns, size)`` stamp changes."""
+
+    def __init__(
+        self,
+        path: Path,
+        build: Callable[[bytes], T],
+        missing: Callable[[], T] | None = None,
+        keep_last_good: bool = False,
+        background: bool = False,
+    ):
+        self.path = path
+        self._build = build
+        self._missing = missing
+        self._keep_last_good = keep_last_good
+        self._background = background
+        self._value: T | None = None
+        self._stamp: Stamp | None = None
+        self._loaded = False
+        self._error: Exception | None = None
+        self._error_stamp: Stamp | None = None
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+
+    def _current_stamp(self) -> Stamp | None:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            if self._missing is None:
+                raise FileNotFoundError(f"File not found: {self.path}") from None
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _cached(self, stamp: Stamp | None) -> T:
+        if self._error is not None and stamp == self._error_stamp:
+            raise self._error.with_traceback(None)
+        return self._value  # type: ignore[return-value]
+
+    def _is_current(self, stamp: Stamp | None) -> bool:
+        if self._error is not None and stamp == self._error_stamp:
+            return True
+        return self._loaded and stamp == self._stamp
+
+    def get(self) -> T:
+        stamp = self._current_stamp()
+        if self._is_current(stamp):
+            return self._cached(stamp)
+        if self._background and self._loaded:
+            # Only the first load blocks; later callers keep the previous value until the swap.
+            previous = self._value
+            self._reload_in_background()
+            return previous  # type: ignore[return-value]
+        return self._reload()
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Block until a background rebuild in flight (if any) has finished."""
+        worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+
+    def _reload_in_background(self) -> None:
+        with self._worker_lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._reload_quietly, name=f"reload-{self.path.name}", daemon=True)
+            self._worker.start()
+
+    def _reload_quietly(self) -> None:
+        try:
+            self._reload()
+        except Exception:
+            pass  # already logged, and re-raised to callers of get() for this stamp
+
+    def _reload(self) -> T:
+        with self._lock:
+            # Re-check under the lock so concurrent callers build only once.
+            stamp = self._current_stamp()
+            if self._is_current(stamp):
+                return self._cached(stamp)
+
+            if stamp is None:
+                value = self._missing()  # type: ignore[misc]
+            else:
+                try:
+                    value = self._build(self.path.read_bytes())
+                except Exception as exc:
+                    # Without a value to keep, remember the failure so a broken file is not rebuilt per call.
+                    if not self._keep_last_good or not (self._loaded or self._missing):
+                        logger.exception("Failed to load %s; failing until it changes", self.path)
+                        self._error, self._error_stamp = exc, stamp
+                        raise
+                    logger.exception("Failed to reload %s; keeping the previous version", self.path)
+                    value = self._value if self._loaded else self._missing()  # type: ignore[misc]
+
+            self._value = value
+            self._stamp = stamp
+            self._loaded = True
+            self._error = self._error_stamp = None
+            return value
@@ -0,0 +1,150 @@
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# The shared directory is scanned for its size once per this many writes.
+_SHARED_PRUNE_INTERVAL = 64
+# Temp files older than this were left behind by a writer that died mid-write.
+_STALE_TMP_NS = 60 * 1_000_000_000
+
+
+class ResponseCache:
+    """LRU cache of serialized responses bounded by payload bytes, optionally shared on disk."""
+
+    def __init__(self, max_bytes: int, shared_dir: str | None = None, shared_max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.shared_dir = Path(shared_dir) if shared_dir else None
+        self.shared_max_bytes = shared_max_bytes
+        self._shared_writes = 0
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    # Keys embed every snapshot version the payload depends on, so reloads never hit old entries.
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def _shared_path(self, key: str) -> Path:
+        return self.shared_dir / key[:2] / f"{key}.json"
+
+    def _remember(self, key: str, payload: bytes) -> None:
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= len(previous)
+            self._entries[key] = payload
+            self.size_bytes += len(payload)
+            while self.size_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size_bytes -= len(evicted)
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return payload
+
+        if self.shared_dir is not None:
+            path = self._shared_path(key)
+            try:
+                payload = path.read_bytes()
+                os.utime(path)  # disk hits count as recent use for the LRU prune
+            except FileNotFoundError:
+                payload = None
+            except OSError:
+                logger.warning("Cannot read shared cache entry %s", path, exc_info=True)
+                payload = None
+            if payload is not None:
+                self._remember(key, payload)
+                with self._lock:
+                    self.hits += 1
+                return payload
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, payload: bytes) -> None:
+        self._remember(key, payload)
+        if self.shared_dir is None:
+            return
+
+        path = self._shared_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(mode="wb", dir=path.parent, suffix=".tmp", delete=False) as fp:
+                try:
+                    fp.write(payload)
+                except OSError:
+                    fp.close()
+                    os.unlink(fp.name)
+                    raise
+            os.replace(fp.name, path)
+        except OSError:
+            logger.warning("Cannot write shared cache entry %s", path, exc_info=True)
+            return
+
+        with self._lock:
+            self._shared_writes += 1
+            due = self._shared_writes % _SHARED_PRUNE_INTERVAL == 0
+        if due:
+            self._prune_shared()
+
+    def discard(self, key: str) -> None:
+        """Drop an entry from both tiers, e.g. after its payload failed to parse."""
+        with self._lock:
+            payload = self._entries.pop(key, None)
+            if payload is not None:
+                self.size_bytes -= len(payload)
+        if self.shared_dir is not None:
+            try:
+                self._shared_path(key).unlink(missing_ok=True)
+            except OSError:
+                logger.warning("Cannot delete shared cache entry for %s", key, exc_info=True)
+
+    def _prune_shared(self) -> None:
+        try:
+            self._evict_shared()
+        except OSError:
+            logger.warning("Cannot prune shared cache directory %s", self.shared_dir, exc_info=True)
+
+    def _evict_shared(self) -> None:
+        # Deletes least recently used files; this is also how entries of old snapshot versions go away.
+        stale_before = time.time_ns() - _STALE_TMP_NS
+        files: list[tuple[int, int, Path]] = []
+        total = 0
+        for path in self.shared_dir.glob("*/*"):
+            if path.suffix not in (".json", ".tmp"):
+                continue
+            try:
+                stat = path.stat()
+                if path.suffix == ".tmp" and stat.st_mtime_ns < stale_before:
+                    path.unlink(missing_ok=True)
+                    continue
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+        if total <= self.shared_max_bytes:
+            return
+
+        files.sort()
+        for _, size, path in files:
+            path.unlink(missing_ok=True)
+            total -= size
+            if total <= self.shared_max_bytes:
+                break
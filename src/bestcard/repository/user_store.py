@@ -0,0 +1,46 @@
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from bestcard.domain.models import UserProfile
+from bestcard.repository.reloading_file import ReloadingFile
+
+
+class UserStore:
+    def __init__(self, profile_file: str):
+        self.profile_file = Path(profile_file)
+        self._profiles = ReloadingFile(self.profile_file, self._parse, missing=dict)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _parse(raw: bytes) -> dict[str, UserProfile]:
+        profiles: dict[str, UserProfile] = {}
+        for item in json.loads(raw):
+            profile = UserProfile.model_validate(item)
+            profiles[profile.user_id] = profile
+        return profiles
+
+    def _load(self) -> dict[str, UserProfile]:
+        """Return the profiles, re-reading the file whenever another process rewrote it."""
+        return self._profiles.get()
+
+    def get_profile(self, user_id: str) -> UserProfile | None:
+        with self._lock:
+            return self._load().get(user_id)
+
+    def save_profile(self, profile: UserProfile) -> None:
+        with self._lock:
+            profiles = dict(self._load())
+            profiles[profile.user_id] = profile
+            self.profile_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                suffix=".json",
+                dir=self.profile_file.parent,
+                delete=False,
+                encoding="utf-8",
+            ) as fp:
+                json.dump([item.model_dump() for item in profiles.values()], fp, ensure_ascii=False, indent=2)
+            os.replace(fp.name, self.profile_file)
@@ -1,4 +1,4 @@
-from .requests import RecommendRequest
-from .responses import RecommendResponse
+from .requests import PortfolioRequest, RecommendRequest
+from .responses import PortfolioResponse, RecommendResponse
 
-__all__ = ["RecommendRequest", "RecommendResponse"]
+__all__ = ["PortfolioRequest", "PortfolioResponse", "RecommendRequest", "RecommendResponse"]
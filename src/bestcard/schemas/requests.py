@@ -1,11 +1,25 @@
-from pydantic import BaseModel
+from datetime import date
+from typing import Annotated
+
+from pydantic import BaseModel, Field
 
 
 class RecommendRequest(BaseModel):
     message: str | None = None
+    user_id: str | None = None
     amount: float | None = None
     category: str | None = None
     is_foreign: bool | None = None
-    currency: str = "USD"
+    currency: str | None = None
     include_annual_fee_proration: bool = False
     monthly_spend_estimate: float | None = None
+    transaction_date: date | None = None
+    full_ranking: bool = False
+
+
+class PortfolioRequest(BaseModel):
+    category_spend: dict[str, Annotated[float, Field(ge=0)]]
+    foreign_share: float = Field(default=0, ge=0, le=1)
+    currency: str = "USD"
+    k: int = Field(default=2, ge=1)
+    time_budget_ms: int = Field(default=500, gt=0, le=5000)
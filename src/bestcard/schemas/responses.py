@@ -1,10 +1,16 @@
 from pydantic import BaseModel
 
-from bestcard.domain.models import CardEvaluation, SpendScenario
+from bestcard.domain.models import CardEvaluation, PortfolioResult, SpendProfile, SpendScenario
 
 
 class RecommendResponse(BaseModel):
     best_card: CardEvaluation
     ranked_cards: list[CardEvaluation]
     parsed_scenario: SpendScenario
+    priced_scenario: SpendScenario
     policy_evidence: list[str]
+
+
+class PortfolioResponse(BaseModel):
+    portfolio: PortfolioResult
+    spend_profile: SpendProfile
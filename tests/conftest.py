@@ -0,0 +1,68 @@
+import copy
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from bestcard.agents.orchestrator import RecommendationOrchestrator
+from bestcard.repository.policy_store import PolicyStore
+
+SAMPLE_CARDS = [
+    {
+        "card_id": "grocery_max",
+        "card_name": "Grocery Max",
+        "base_cashback_rate": 0.01,
+        "reward_rules": [{"category": "grocery", "cashback_rate": 0.05}],
+    },
+    {
+        "card_id": "dining_max",
+        "card_name": "Dining Max",
+        "base_cashback_rate": 0.01,
+        "reward_rules": [{"category": "dining", "cashback_rate": 0.04}],
+    },
+    {"card_id": "flat_two", "card_name": "Flat Two", "base_cashback_rate": 0.02},
+]
+
+
+def _bump_mtime(path: Path) -> None:
+    # Move mtime well past the previous stamp so reloads do not depend on timestamp granularity.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def bump_mtime() -> Callable[[Path], None]:
+    return _bump_mtime
+
+
+@pytest.fixture
+def sample_cards() -> list[dict]:
+    return copy.deepcopy(SAMPLE_CARDS)
+
+
+@pytest.fixture
+def policy_file(tmp_path: Path) -> Path:
+    path = tmp_path / "cards.json"
+    path.write_text(json.dumps(SAMPLE_CARDS), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def write_cards(policy_file: Path) -> Callable[[list[dict]], None]:
+    def write(cards: list[dict]) -> None:
+        policy_file.write_text(json.dumps(cards), encoding="utf-8")
+        _bump_mtime(policy_file)
+
+    return write
+
+
+@pytest.fixture
+def make_orchestrator(policy_file: Path) -> Callable[..., RecommendationOrchestrator]:
+    """Build an orchestrator over ``policy_file``; keyword arguments are passed through as stores."""
+
+    def make(**stores) -> RecommendationOrchestrator:
+        return RecommendationOrchestrator(PolicyStore(str(policy_file)), **stores)
+
+    return make
@@ -0,0 +1,66 @@
+import asyncio
+import threading
+
+import httpx
+
+from bestcard.api.admission import AdmissionLimiter
+from bestcard.api.app import app
+from bestcard.api.routes import recommend as recommend_route
+
+
+async def _until(condition) -> None:
+    while not condition():
+        await asyncio.sleep(0.01)
+
+
+def test_saturated_message_limiter_does_not_block_other_routes(monkeypatch) -> None:
+    recommend = recommend_route.orchestrator.recommend
+    entered = threading.Event()
+    release = threading.Event()
+
+    def blocking_messages(request):
+        # Message requests hold their slot until released and never reach the LLM parser.
+        if request.message:
+            entered.set()
+            release.wait(timeout=10)
+            request = request.model_copy(update={"message": None, "amount": 100, "category": "grocery"})
+        return recommend(request)
+
+    limiter = AdmissionLimiter("message", 1, 1, 0.2, retry_after_s=3)
+    monkeypatch.setattr(recommend_route, "llm_limiter", limiter)
+    monkeypatch.setattr(recommend_route.orchestrator, "recommend", blocking_messages)
+
+    async def scenario() -> None:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            running = asyncio.create_task(client.post("/recommend", json={"message": "spent 100 on groceries"}))
+            assert await asyncio.to_thread(entered.wait, 10)
+
+            queued = asyncio.create_task(client.post("/recommend", json={"message": "spent 20 on gas"}))
+            await asyncio.wait_for(_until(lambda: limiter.waiting == 1), timeout=5)
+
+            shed = await client.post("/recommend", json={"message": "spent 50 on dining"})
+            assert shed.status_code == 429
+            assert shed.headers["Retry-After"] == "3"
+
+            # Both would hang until the message slot frees up if they shared its limiter.
+            structured = await asyncio.wait_for(
+                client.post("/recommend", json={"amount": 100, "category": "grocery"}), timeout=5
+            )
+            health = await asyncio.wait_for(client.get("/health"), timeout=5)
+            assert structured.status_code == 200
+            assert health.status_code == 200
+
+            timed_out = await queued
+            assert timed_out.status_code == 503
+            assert timed_out.headers["Retry-After"] == "3"
+
+            release.set()
+            completed = await running
+            assert completed.status_code == 200
+            assert completed.json()["best_card"]["card_id"] == structured.json()["best_card"]["card_id"]
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        release.set()
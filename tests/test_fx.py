@@ -0,0 +1,123 @@
+import json
+
+import pytest
+
+from bestcard.agents.orchestrator import RecommendationOrchestrator
+from bestcard.repository.fx_store import FxSnapshot, FxStore
+from bestcard.schemas.requests import PortfolioRequest, RecommendRequest
+
+RATES = {"base": "USD", "as_of": "2026-10-01", "rates": {"EUR": 0.8, "JPY": 150}}
+
+
+@pytest.fixture
+def fx_store(tmp_path) -> FxStore:
+    rates_file = tmp_path / "rates.json"
+    rates_file.write_text(json.dumps(RATES), encoding="utf-8")
+    return FxStore(str(rates_file))
+
+
+@pytest.fixture
+def mixed_orchestrator(make_orchestrator, fx_store, sample_cards, write_cards) -> RecommendationOrchestrator:
+    write_cards(
+        [
+            *sample_cards,
+            {
+                "card_id": "yen_grocery",
+                "card_name": "Yen Grocery",
+                "currency": "JPY",
+                "annual_fee": 18000,
+                "base_cashback_rate": 0.01,
+                "reward_rules": [
+                    {"category": "grocery", "cashback_rate": 0.09, "cap_amount": 150000, "cap_period": "month"}
+                ],
+            },
+        ]
+    )
+    return make_orchestrator(fx_store=fx_store)
+
+
+def test_snapshot_converts_through_the_base_currency() -> None:
+    snapshot = FxSnapshot("USD", RATES["rates"], "test")
+
+    assert snapshot.convert(80, "eur", "USD") == pytest.approx(100)
+    assert snapshot.convert(80, "EUR", "JPY") == pytest.approx(15000)
+    assert snapshot.convert_many([80, 150, 5], ["EUR", "JPY", "USD"], "USD") == pytest.approx([100, 1, 5])
+    with pytest.raises(ValueError):
+        snapshot.factor("USD", "CHF")
+
+
+@pytest.mark.parametrize("rate", [0, -1.5, float("nan"), float("inf")])
+def test_snapshot_rejects_invalid_rates(rate: float) -> None:
+    with pytest.raises(ValueError, match="EUR"):
+        FxSnapshot("USD", {"EUR": rate}, "bad")
+
+
+def test_store_reloads_changed_rates(tmp_path, bump_mtime) -> None:
+    rates_file = tmp_path / "rates.json"
+    rates_file.write_text(json.dumps(RATES), encoding="utf-8")
+    store = FxStore(str(rates_file))
+    first = store.load_snapshot()
+    assert store.load_snapshot() is first
+
+    rates_file.write_text(json.dumps({**RATES, "rates": {"EUR": 0.5}}), encoding="utf-8")
+    bump_mtime(rates_file)
+
+    assert store.load_snapshot().factor("EUR", "USD") == pytest.approx(2)
+
+
+def test_recommend_prices_foreign_currency_amounts(make_orchestrator, fx_store) -> None:
+    orchestrator = make_orchestrator(fx_store=fx_store)
+    result = orchestrator.recommend(RecommendRequest(amount=80, category="grocery", currency="eur"))
+
+    assert result.priced_scenario.currency == "USD"
+    assert result.priced_scenario.amount == pytest.approx(100)
+    assert result.best_card.cashback == pytest.approx(5)
+
+
+def test_portfolio_reports_the_catalog_currency(make_orchestrator, fx_store) -> None:
+    result = make_orchestrator(fx_store=fx_store).optimize_portfolio(
+        PortfolioRequest(category_spend={"grocery": 80}, currency="EUR", k=1)
+    )
+
+    assert result.spend_profile.currency == "EUR"
+    assert result.portfolio.currency == "USD"
+    assert result.portfolio.yearly_net_reward == pytest.approx(100 * 12 * 0.05)
+
+
+def test_mixed_currency_catalog_converts_card_fees(mixed_orchestrator) -> None:
+    orchestrator = mixed_orchestrator
+    catalog = orchestrator.policy_store.load_catalog()
+    assert catalog.currency == "USD"
+    assert catalog.currencies == {"USD", "JPY"}
+
+    plain = orchestrator.recommend(RecommendRequest(amount=100, category="grocery"))
+    prorated = orchestrator.recommend(
+        RecommendRequest(amount=100, category="grocery", include_annual_fee_proration=True, monthly_spend_estimate=500)
+    )
+
+    assert plain.best_card.card_id == "yen_grocery"
+    # 18000 JPY = 120 USD a year, 10 USD a month, which outweighs the extra 4% on 100 USD.
+    assert prorated.best_card.card_id == "grocery_max"
+    yen = next(item for item in prorated.ranked_cards if item.card_id == "yen_grocery")
+    assert yen.fee == pytest.approx(10)
+
+
+def test_mixed_currency_pruning_matches_full_ranking(mixed_orchestrator) -> None:
+    orchestrator = mixed_orchestrator
+    for category in ("grocery", "dining"):
+        request = {"amount": 100, "category": category, "include_annual_fee_proration": True}
+        request["monthly_spend_estimate"] = 500
+        pruned = orchestrator.recommend(RecommendRequest(**request))
+        full = orchestrator.recommend(RecommendRequest(**request, full_ranking=True))
+        assert pruned.best_card == full.best_card
+
+
+def test_portfolio_converts_fees_and_caps_per_card_currency(mixed_orchestrator) -> None:
+    result = mixed_orchestrator.optimize_portfolio(
+        PortfolioRequest(category_spend={"grocery": 1500}, k=1)
+    )
+
+    # The cap is 150000 JPY = 1000 USD a month: 12000 * 0.09 + 6000 * 0.01 - 120 = 1020 beats 18000 * 0.05 = 900.
+    assert result.portfolio.card_ids == ["yen_grocery"]
+    assert result.portfolio.yearly_net_reward == pytest.approx(1020)
+    assert result.portfolio.yearly_annual_fee == pytest.approx(120)
@@ -0,0 +1,109 @@
+import json
+import random
+
+import pytest
+
+from bestcard.domain.models import MerchantEntry
+from bestcard.nlp.merchants import MerchantMatcher
+from bestcard.repository import merchant_store
+from bestcard.repository.merchant_store import MerchantStore
+
+ENTRIES = [
+    {"name": "Walmart", "category": "grocery", "aliases": ["wal-mart", "沃尔玛"]},
+    {"name": "Supermarket", "category": "grocery", "aliases": ["超市"], "mcc": ["5411"]},
+    {"name": "Shell", "category": "gas", "aliases": ["shell oil"]},
+    {"name": "Restaurant", "category": "dining", "mcc": ["5812"]},
+]
+
+
+def test_find_all_matches_naive_search() -> None:
+    rng = random.Random(1)
+    alphabet = "ab 超市"
+    for _ in range(200):
+        patterns = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))).strip() for _ in range(6)}
+        patterns.discard("")
+        entries = [MerchantEntry(name=pattern, category="other") for pattern in patterns]
+        matcher = MerchantMatcher(entries)
+        text = "".join(rng.choice(alphabet) for _ in range(30))
+
+        found = {(match.merchant, match.start, match.end) for match in matcher.find_all(text)}
+        expected = {
+            (pattern, start, start + len(pattern))
+            for pattern in patterns
+            for start in range(len(text) - len(pattern) + 1)
+            if text[start : start + len(pattern)] == pattern
+            and MerchantMatcher._on_boundary(text, start, start + len(pattern))
+        }
+        assert found == expected
+
+
+def test_resolve_prefers_mcc_then_longest_match() -> None:
+    matcher = MerchantMatcher(MerchantEntry.model_validate(item) for item in ENTRIES)
+
+    assert matcher.resolve("Shell Oil #123").merchant == "Shell"
+    assert matcher.resolve("shellfish dinner") is None
+    assert matcher.resolve("在沃尔玛买菜").category == "grocery"
+    assert matcher.resolve("Shell MCC 5812").merchant == "Restaurant"
+    assert matcher.resolve("Walmart", mcc="5411").merchant == "Supermarket"
+
+
+def test_store_keeps_last_good_matcher_on_bad_reload(tmp_path, bump_mtime) -> None:
+    dictionary = tmp_path / "merchants.json"
+    dictionary.write_text(json.dumps(ENTRIES), encoding="utf-8")
+    store = MerchantStore(str(dictionary))
+    good = store.load_matcher()
+    assert good.resolve("walmart").merchant == "Walmart"
+
+    dictionary.write_text("[{not json", encoding="utf-8")
+    bump_mtime(dictionary)
+    assert store.load_matcher() is good
+    store._matcher.wait()
+    assert store.load_matcher() is good
+
+    dictionary.write_text(json.dumps(ENTRIES[2:]), encoding="utf-8")
+    bump_mtime(dictionary)
+    assert store.load_matcher() is good
+    store._matcher.wait()
+    assert store.load_matcher().resolve("walmart") is None
+
+
+def test_store_rejects_unknown_categories(tmp_path) -> None:
+    dictionary = tmp_path / "merchants.json"
+    dictionary.write_text(json.dumps([{"name": "Casino", "category": "gambling"}]), encoding="utf-8")
+
+    matcher = MerchantStore(str(dictionary)).load_matcher()
+
+    assert len(matcher) == 0
+    assert matcher.resolve("casino") is None
+
+
+def test_compiled_matcher_round_trips() -> None:
+    matcher = MerchantMatcher(MerchantEntry.model_validate(item) for item in ENTRIES)
+    text = "Shell Oil then 沃尔玛, MCC 5812"
+
+    loaded = MerchantMatcher.from_bytes(matcher.to_bytes("v1"), "v1")
+
+    assert loaded.find_all(text) == matcher.find_all(text)
+    assert loaded.resolve(text) == matcher.resolve(text)
+    with pytest.raises(ValueError):
+        MerchantMatcher.from_bytes(matcher.to_bytes("v1"), "v2")
+    with pytest.raises(ValueError):
+        MerchantMatcher.from_bytes(matcher.to_bytes("v1")[:-4], "v1")
+
+
+def test_store_starts_from_the_compiled_file(tmp_path, monkeypatch) -> None:
+    dictionary = tmp_path / "merchants.json"
+    dictionary.write_text(json.dumps(ENTRIES), encoding="utf-8")
+    compiled = tmp_path / "merchants.matcher"
+    MerchantStore(str(dictionary), str(compiled)).load_matcher()
+    assert compiled.exists()
+
+    def no_parsing(raw):
+        raise AssertionError("dictionary was parsed again")
+
+    monkeypatch.setattr(merchant_store._ENTRIES, "validate_json", no_parsing)
+    assert MerchantStore(str(dictionary), str(compiled)).load_matcher().resolve("walmart").merchant == "Walmart"
+
+    monkeypatch.undo()
+    dictionary.write_text(json.dumps(ENTRIES[2:]), encoding="utf-8")
+    assert MerchantStore(str(dictionary), str(compiled)).load_matcher().resolve("walmart") is None
@@ -0,0 +1,98 @@
+import random
+
+from bestcard.domain.models import CardPolicy, SpendScenario
+from bestcard.engine.catalog import CompiledCatalog
+from bestcard.engine.selectors import rank_cards
+
+CATEGORIES = ["grocery", "dining", "travel", "gas"]
+
+
+def _card(card_id: str, **fields) -> CardPolicy:
+    return CardPolicy(card_id=card_id, card_name=card_id.title(), **fields)
+
+
+def _random_catalog(rng: random.Random, size: int) -> CompiledCatalog:
+    cards = [
+        _card(
+            f"card_{index}",
+            annual_fee=rng.choice([0, 0, 95, 250]),
+            foreign_txn_fee_rate=rng.choice([0, 0.03]),
+            base_cashback_rate=rng.choice([0.01, 0.015, 0.02]),
+            reward_rules=[
+                {"category": category, "cashback_rate": rng.choice([0.02, 0.03, 0.05])}
+                for category in rng.sample(CATEGORIES, rng.randint(0, 2))
+            ],
+        )
+        for index in range(size)
+    ]
+    return CompiledCatalog(cards, version="test")
+
+
+def test_pruned_ranking_picks_the_same_best_card() -> None:
+    rng = random.Random(5)
+    for _ in range(200):
+        catalog = _random_catalog(rng, rng.randint(1, 25))
+        scenario = SpendScenario(
+            amount=rng.choice([5, 40, 120, 900]),
+            category=rng.choice([*CATEGORIES, "entertainment"]),
+            is_foreign=rng.random() < 0.5,
+            include_annual_fee_proration=rng.random() < 0.5,
+            monthly_spend_estimate=rng.choice([None, 1500]),
+        )
+
+        pruned = rank_cards(catalog, scenario)[0]
+        full = rank_cards(catalog, scenario, full_ranking=True)[0]
+
+        assert (pruned.card_id, pruned.net_reward, pruned.cashback) == (full.card_id, full.net_reward, full.cashback)
+
+
+def test_dominated_card_is_not_a_candidate() -> None:
+    catalog = CompiledCatalog(
+        [
+            _card("strong", reward_rules=[{"category": "grocery", "cashback_rate": 0.05}]),
+            _card("weak", annual_fee=95, reward_rules=[{"category": "grocery", "cashback_rate": 0.04}]),
+            _card("flat_one", base_cashback_rate=0.01),
+            _card("strong_twin", reward_rules=[{"category": "grocery", "cashback_rate": 0.05}]),
+        ],
+        version="test",
+    )
+    candidates = catalog.candidates(SpendScenario(amount=100, category="grocery"))
+
+    # "weak" and "flat_one" lose on every term and the later exact twin adds nothing.
+    assert [card.card_id for card in candidates] == ["strong"]
+
+
+def test_pruning_stats_count_frontier_cards() -> None:
+    catalog = CompiledCatalog(
+        [
+            _card("grocery_max", reward_rules=[{"category": "grocery", "cashback_rate": 0.05}]),
+            _card("flat_two", base_cashback_rate=0.02),
+            _card("flat_one", base_cashback_rate=0.01),
+        ],
+        version="test",
+    )
+
+    stats = catalog.pruning_stats()
+
+    assert stats["grocery:domestic:plain"] == 1
+    assert stats["*:domestic:plain"] == 1
+    assert len(stats) == 2 * 2 * 2
+
+
+def test_ranking_uses_unrounded_rewards() -> None:
+    # Both earn 0.03 after rounding to cents; only the exact values tell them apart.
+    catalog = CompiledCatalog(
+        [
+            _card("a", reward_rules=[{"category": "grocery", "cashback_rate": 0.03}]),
+            _card("b", reward_rules=[{"category": "grocery", "cashback_rate": 0.0301}]),
+        ],
+        version="test",
+    )
+    scenario = SpendScenario(amount=1, category="grocery")
+
+    pruned = rank_cards(catalog, scenario)
+    full = rank_cards(catalog, scenario, full_ranking=True)
+
+    assert pruned[0].card_id == full[0].card_id == "b"
+    assert [item.card_id for item in full] == ["b", "a"]
+    assert full[0].net_reward == full[1].net_reward == 0.03
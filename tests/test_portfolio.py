@@ -0,0 +1,157 @@
+import itertools
+import random
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from bestcard.domain.models import CardPolicy, SpendProfile
+from bestcard.engine.portfolio import _Search, _prune_dominated, _yearly_category_value, optimize_portfolio
+from bestcard.schemas.requests import PortfolioRequest
+
+CATEGORIES = ["grocery", "dining", "travel", "gas", "online_shopping", "other"]
+TODAY = date(2026, 1, 15)
+
+
+def _random_catalog(rng: random.Random, size: int) -> list[CardPolicy]:
+    cards = []
+    for index in range(size):
+        rules = [
+            {
+                "category": category,
+                "cashback_rate": rng.choice([0.02, 0.03, 0.04, 0.05]),
+                "cap_amount": rng.choice([None, 500, 1500, 6000]),
+                "cap_period": rng.choice(["year", "quarter", "month"]),
+            }
+            for category in rng.sample(CATEGORIES, rng.randint(0, 3))
+        ]
+        cards.append(
+            CardPolicy(
+                card_id=f"card_{index}",
+                card_name=f"Card {index}",
+                annual_fee=rng.choice([0, 0, 95, 250]),
+                foreign_txn_fee_rate=rng.choice([0, 0.03]),
+                base_cashback_rate=rng.choice([0.01, 0.015, 0.02]),
+                reward_rules=rules,
+            )
+        )
+    return cards
+
+
+def _brute_force(cards: list[CardPolicy], profile: SpendProfile, k: int) -> float:
+    categories = sorted(profile.category_spend)
+    best = float("-inf")
+    for size in range(1, k + 1):
+        for subset in itertools.combinations(cards, size):
+            value = sum(
+                max(
+                    _yearly_category_value(
+                        card, category, profile.category_spend[category] * 12, profile.foreign_share, TODAY
+                    )
+                    for card in subset
+                )
+                for category in categories
+            ) - sum(card.annual_fee for card in subset)
+            best = max(best, value)
+    return best
+
+
+def test_optimizer_matches_brute_force_on_small_catalogs() -> None:
+    rng = random.Random(7)
+    for _ in range(60):
+        cards = _random_catalog(rng, rng.randint(1, 10))
+        profile = SpendProfile(
+            category_spend={category: rng.choice([0, 100, 500, 1500]) for category in rng.sample(CATEGORIES, 4)},
+            foreign_share=rng.random() * 0.3,
+        )
+        k = rng.randint(1, 4)
+
+        result = optimize_portfolio(cards, profile, k, time_budget_s=10, on=TODAY)
+
+        assert result.optimal
+        assert 1 <= len(result.card_ids) <= k
+        assert result.yearly_net_reward == pytest.approx(round(_brute_force(cards, profile, k), 2), abs=0.011)
+
+
+def test_k_larger_than_candidate_count() -> None:
+    cards = _random_catalog(random.Random(3), 3)
+    profile = SpendProfile(category_spend={"grocery": 800, "dining": 400, "travel": 300})
+
+    result = optimize_portfolio(cards, profile, k=10, on=TODAY)
+
+    assert result.optimal
+    assert len(result.card_ids) <= result.candidates <= 3
+    assert result.yearly_net_reward == pytest.approx(round(_brute_force(cards, profile, 3), 2), abs=0.011)
+
+
+@pytest.mark.parametrize(
+    ("cap_period", "expected"),
+    [
+        # 12000/year spend; 1000 cap per period at 5%, the rest at 1%.
+        ("year", 1000 * 0.05 + 11000 * 0.01),
+        ("quarter", 4000 * 0.05 + 8000 * 0.01),
+        ("month", 12000 * 0.05),
+    ],
+)
+def test_cap_periods_scale_to_a_year(cap_period: str, expected: float) -> None:
+    card = CardPolicy(
+        card_id="capped",
+        card_name="Capped",
+        base_cashback_rate=0.01,
+        reward_rules=[{"category": "grocery", "cashback_rate": 0.05, "cap_amount": 1000, "cap_period": cap_period}],
+    )
+
+    result = optimize_portfolio([card], SpendProfile(category_spend={"grocery": 1000}), k=1, on=TODAY)
+
+    assert result.yearly_net_reward == pytest.approx(expected)
+    assert result.routes[0].card_id == "capped"
+
+
+def test_dominated_cards_are_pruned() -> None:
+    values = [[10.0, 5.0], [10.0, 4.0], [3.0, 8.0], [10.0, 5.0]]
+    fixed = [0.0, 0.0, 0.0, 0.0]
+
+    kept, complete = _prune_dominated(values, fixed, deadline=float("inf"))
+
+    # Card 1 is beaten by card 0, and card 3 is an exact tie that keeps the earlier card.
+    assert complete
+    assert sorted(kept) == [0, 2]
+
+
+def test_greedy_seed_is_recorded_before_search() -> None:
+    values = [[10.0, 0.0, 0.0], [0.0, 9.0, 0.0], [0.0, 0.0, 1.0]]
+    search = _Search(values, [0.0, 0.0, 2.0], k=2, deadline=float("inf"))
+
+    search.greedy()
+
+    assert search.best_set == (0, 1)
+    assert search.best_value == pytest.approx(19.0)
+    assert search.nodes == 0
+
+
+def test_exhausted_budget_returns_best_so_far() -> None:
+    cards = _random_catalog(random.Random(11), 200)
+    profile = SpendProfile(category_spend={category: 500 for category in CATEGORIES})
+
+    result = optimize_portfolio(cards, profile, k=3, time_budget_s=0, on=TODAY)
+
+    assert not result.optimal
+    assert 1 <= len(result.card_ids) <= 3
+    assert len(result.routes) == len(CATEGORIES)
+    assert {route.card_id for route in result.routes} <= set(result.card_ids)
+
+
+def test_zero_budget_stops_valuation_after_the_first_batch() -> None:
+    cards = _random_catalog(random.Random(13), 500)
+    profile = SpendProfile(category_spend={category: 500 for category in CATEGORIES})
+
+    result = optimize_portfolio(cards, profile, k=2, time_budget_s=0, on=TODAY)
+
+    assert not result.optimal
+    assert result.candidates == 64
+    assert {int(card_id.split("_")[1]) for card_id in result.card_ids} < set(range(64))
+
+
+def test_request_time_budget_is_capped() -> None:
+    with pytest.raises(ValidationError):
+        PortfolioRequest(category_spend={"grocery": 100}, time_budget_ms=60_000)
@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+from bestcard.repository.policy_store import PolicyStore
+from bestcard.repository.reloading_file import ReloadingFile
+
+
+def test_failed_build_is_not_retried_until_the_file_changes(tmp_path, bump_mtime) -> None:
+    path = tmp_path / "data.json"
+    path.write_text("{broken", encoding="utf-8")
+    builds = []
+
+    def build(raw: bytes) -> dict:
+        builds.append(raw)
+        return json.loads(raw)
+
+    loader = ReloadingFile(path, build)
+    for _ in range(3):
+        with pytest.raises(json.JSONDecodeError):
+            loader.get()
+    assert len(builds) == 1
+
+    path.write_text('{"ok": true}', encoding="utf-8")
+    bump_mtime(path)
+    assert loader.get() == {"ok": True}
+    assert len(builds) == 2
+
+
+def test_policy_store_keeps_the_last_good_catalog(policy_file, write_cards) -> None:
+    store = PolicyStore(str(policy_file))
+    catalog = store.load_catalog()
+
+    write_cards([{"card_id": "flat"}])
+
+    assert store.load_catalog() is catalog
@@ -0,0 +1,103 @@
+import json
+import os
+
+from bestcard.repository.response_cache import ResponseCache
+from bestcard.schemas.requests import RecommendRequest
+
+def test_equivalent_requests_share_one_entry(make_orchestrator) -> None:
+    cache = ResponseCache(1 << 20)
+    orchestrator = make_orchestrator(response_cache=cache)
+
+    first = orchestrator.recommend(RecommendRequest(amount=100, category="Grocery"))
+    second = orchestrator.recommend(RecommendRequest(amount=100.0, category="grocery ", currency="usd"))
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second == first
+    assert first.parsed_scenario.category == "grocery"
+    assert first.best_card.card_id == "grocery_max"
+
+
+def test_policy_reload_changes_the_key(make_orchestrator, sample_cards, write_cards) -> None:
+    cache = ResponseCache(1 << 20)
+    orchestrator = make_orchestrator(response_cache=cache)
+    assert orchestrator.recommend(RecommendRequest(amount=100, category="grocery")).best_card.card_id == "grocery_max"
+
+    write_cards([card for card in sample_cards if card["card_id"] != "grocery_max"])
+
+    assert orchestrator.recommend(RecommendRequest(amount=100, category="grocery")).best_card.card_id == "flat_two"
+    assert cache.hits == 0
+
+
+def test_corrupt_shared_entry_is_a_miss(tmp_path, make_orchestrator) -> None:
+    shared = tmp_path / "shared"
+    request = RecommendRequest(amount=100, category="grocery")
+    expected = make_orchestrator(response_cache=ResponseCache(1 << 20, str(shared))).recommend(request)
+    (entry,) = shared.glob("*/*.json")
+    entry.write_bytes(b'{"best_card": ')
+
+    result = make_orchestrator(response_cache=ResponseCache(1 << 20, str(shared))).recommend(request)
+
+    assert result == expected
+    assert json.loads(entry.read_bytes())["best_card"]["card_id"] == "grocery_max"
+
+
+def test_discard_removes_both_tiers(tmp_path) -> None:
+    cache = ResponseCache(1 << 20, str(tmp_path))
+    cache.put("ab12", b"payload")
+
+    cache.discard("ab12")
+
+    assert cache.size_bytes == 0
+    assert cache.get("ab12") is None
+    assert not list(tmp_path.glob("*/*.json"))
+
+
+def test_shared_dir_stays_within_its_budget(tmp_path) -> None:
+    cache = ResponseCache(1 << 20, str(tmp_path), shared_max_bytes=1000)
+    for index in range(64):
+        key = ResponseCache.make_key(str(index))
+        cache.put(key, b"x" * 100)
+        path = cache._shared_path(key)
+        os.utime(path, ns=(index * 1_000_000, index * 1_000_000))
+
+    files = list(tmp_path.glob("*/*.json"))
+    assert sum(path.stat().st_size for path in files) <= 1000
+    assert cache._shared_path(ResponseCache.make_key("63")) in files
+    assert cache._shared_path(ResponseCache.make_key("0")) not in files
+
+
+def test_shared_tier_errors_fall_back_to_memory(tmp_path, make_orchestrator) -> None:
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_bytes(b"")
+    cache = ResponseCache(1 << 20, str(not_a_dir))
+    orchestrator = make_orchestrator(response_cache=cache)
+
+    first = orchestrator.recommend(RecommendRequest(amount=100, category="grocery"))
+    second = orchestrator.recommend(RecommendRequest(amount=100, category="grocery"))
+
+    assert second == first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_unreadable_shared_entry_is_a_miss(tmp_path) -> None:
+    cache = ResponseCache(1 << 20, str(tmp_path))
+    cache._shared_path("ab12").mkdir(parents=True)
+
+    assert cache.get("ab12") is None
+    cache.put("cd34", b"payload")
+    assert cache.get("cd34") == b"payload"
+
+
+def test_prune_removes_stale_temp_files(tmp_path) -> None:
+    cache = ResponseCache(1 << 20, str(tmp_path), shared_max_bytes=1000)
+    stale = tmp_path / "ab" / "leftover.tmp"
+    stale.parent.mkdir()
+    stale.write_bytes(b"x" * 100)
+    os.utime(stale, ns=(0, 0))
+    fresh = tmp_path / "ab" / "writing.tmp"
+    fresh.write_bytes(b"x" * 100)
+
+    cache._prune_shared()
+
+    assert not stale.exists()
+    assert fresh.exists()
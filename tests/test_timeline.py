@@ -0,0 +1,117 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from bestcard.domain.models import CardPolicy, RewardRule, SpendScenario
+from bestcard.engine.catalog import CompiledCatalog
+from bestcard.engine.replay import replay_transactions
+from bestcard.engine.selectors import rank_cards
+from bestcard.engine.timeline import CardTimeline
+
+Q1 = date(2026, 1, 1)
+Q2 = date(2026, 4, 1)
+Q3 = date(2026, 7, 1)
+
+ROTATING = CardPolicy(
+    card_id="rotating",
+    card_name="Rotating",
+    base_cashback_rate=0.01,
+    reward_rules=[
+        {"category": "grocery", "cashback_rate": 0.05, "effective_from": Q1, "effective_to": Q2},
+        {"category": "gas", "cashback_rate": 0.05, "effective_from": Q2, "effective_to": Q3},
+    ],
+)
+FLAT = CardPolicy(card_id="flat", card_name="Flat", base_cashback_rate=0.02)
+
+
+def test_timeline_returns_rules_in_effect() -> None:
+    timeline = CardTimeline(ROTATING)
+
+    assert timeline.rules_on(Q1 - timedelta(days=1)) == {}
+    assert set(timeline.rules_on(Q1)) == {"grocery"}
+    assert set(timeline.rules_on(Q2 - timedelta(days=1))) == {"grocery"}
+    assert set(timeline.rules_on(Q2)) == {"gas"}
+    assert timeline.rules_on(Q3) == {}
+    assert timeline.rate_bounds("grocery") == (0.01, 0.05)
+
+
+def test_replay_uses_the_rules_of_each_date() -> None:
+    catalog = CompiledCatalog([ROTATING, FLAT], version="test")
+    rows = [
+        SpendScenario(amount=100, category="grocery", transaction_date=Q1),
+        SpendScenario(amount=100, category="grocery", transaction_date=Q2),
+        SpendScenario(amount=100, category="gas", transaction_date=Q2),
+    ]
+
+    assert [item.card_id for item in replay_transactions(catalog, rows)] == ["rotating", "flat", "rotating"]
+
+
+def test_reward_rule_rejects_empty_effective_range() -> None:
+    with pytest.raises(ValidationError):
+        RewardRule(category="grocery", cashback_rate=0.05, effective_from=Q2, effective_to=Q2)
+    with pytest.raises(ValidationError):
+        RewardRule(category="grocery", cashback_rate=0.05, effective_from=Q3, effective_to=Q2)
+
+
+def test_equal_rate_ranges_keep_the_earlier_card() -> None:
+    # "ranged" earns 0.04 only from Q2; the later "fixed" card always earns 0.04.
+    ranged = CardPolicy(
+        card_id="ranged",
+        card_name="Ranged",
+        base_cashback_rate=0.02,
+        reward_rules=[{"category": "grocery", "cashback_rate": 0.04, "effective_from": Q2}],
+    )
+    fixed = CardPolicy(
+        card_id="fixed",
+        card_name="Fixed",
+        base_cashback_rate=0.02,
+        reward_rules=[{"category": "grocery", "cashback_rate": 0.04}],
+    )
+    catalog = CompiledCatalog([ranged, fixed], version="test")
+    scenario = SpendScenario(amount=100, category="grocery", transaction_date=Q2)
+
+    assert rank_cards(catalog, scenario)[0].card_id == "ranged"
+    assert rank_cards(catalog, scenario, full_ranking=True)[0].card_id == "ranged"
+
+
+def test_pruned_ranking_matches_full_ranking_on_dated_catalogs() -> None:
+    rng = random.Random(9)
+    days = [Q1, Q2, Q3, date(2026, 10, 1)]
+    for _ in range(200):
+        cards = []
+        for index in range(rng.randint(1, 12)):
+            rules = []
+            for category in rng.sample(["grocery", "gas", "dining"], rng.randint(0, 2)):
+                start, end = sorted(rng.sample([None, *days], 2), key=lambda day: day or date.min)
+                rules.append(
+                    {
+                        "category": category,
+                        "cashback_rate": rng.choice([0.02, 0.03, 0.04]),
+                        "effective_from": start,
+                        "effective_to": end if rng.random() < 0.7 else None,
+                    }
+                )
+            cards.append(
+                CardPolicy(
+                    card_id=f"card_{index}",
+                    card_name=f"Card {index}",
+                    base_cashback_rate=rng.choice([0.01, 0.02]),
+                    annual_fee=rng.choice([0, 95]),
+                    reward_rules=rules,
+                )
+            )
+        catalog = CompiledCatalog(cards, version="test")
+        scenario = SpendScenario(
+            amount=100,
+            category=rng.choice(["grocery", "gas", "dining", "travel"]),
+            transaction_date=rng.choice(days) + timedelta(days=rng.randint(-1, 1)),
+            include_annual_fee_proration=rng.random() < 0.5,
+            monthly_spend_estimate=1000,
+        )
+
+        pruned = rank_cards(catalog, scenario)[0]
+        full = rank_cards(catalog, scenario, full_ranking=True)[0]
+
+        assert (pruned.card_id, pruned.net_reward) == (full.card_id, full.net_reward)
@@ -0,0 +1,41 @@
+from bestcard.domain.models import UserProfile
+from bestcard.repository.user_store import UserStore
+from bestcard.schemas.requests import RecommendRequest
+
+
+def test_wallet_limits_ranking_to_owned_cards(tmp_path, make_orchestrator) -> None:
+    user_store = UserStore(str(tmp_path / "profiles.json"))
+    orchestrator = make_orchestrator(user_store=user_store)
+    user_store.save_profile(UserProfile(user_id="u1", card_ids=["dining_max", "flat_two"]))
+
+    result = orchestrator.recommend(
+        RecommendRequest(user_id="u1", amount=100, category="grocery", full_ranking=True)
+    )
+
+    assert result.best_card.card_id == "flat_two"
+    assert {item.card_id for item in result.ranked_cards} == {"dining_max", "flat_two"}
+
+
+def test_unknown_user_and_empty_wallet_fall_back_to_full_catalog(tmp_path, make_orchestrator) -> None:
+    user_store = UserStore(str(tmp_path / "profiles.json"))
+    orchestrator = make_orchestrator(user_store=user_store)
+    user_store.save_profile(UserProfile(user_id="empty", card_ids=[]))
+
+    for user_id in ("nobody", "empty"):
+        result = orchestrator.recommend(RecommendRequest(user_id=user_id, amount=100, category="grocery"))
+        assert result.best_card.card_id == "grocery_max"
+
+
+def test_profile_saved_by_another_process_is_picked_up(tmp_path, bump_mtime) -> None:
+    profile_file = tmp_path / "profiles.json"
+    api_store = UserStore(str(profile_file))
+    bot_store = UserStore(str(profile_file))
+    assert api_store.get_profile("u1") is None
+
+    bot_store.save_profile(UserProfile(user_id="u1", card_ids=["flat_two"]))
+    bump_mtime(profile_file)
+
+    assert api_store.get_profile("u1").card_ids == ["flat_two"]
+
+    bot_store.save_profile(UserProfile(user_id="u2", card_ids=["dining_max"]))
+    assert {api_store.get_profile(user_id).card_ids[0] for user_id in ("u1", "u2")} == {"flat_two", "dining_max"}